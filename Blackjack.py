@@ -1,5 +1,7 @@
 # Import the random module to use for shuffling cards
 import random
+import sys
+from array import array
 
 # Define a dictionary for ASCII art representations of card suits
 SUITS = {
@@ -14,12 +16,26 @@ CARD_TEMPLATE = """
 ┌─────────┐
 │{}       │
 │         │
-│    {}   │
+│    {}    │
 │         │
 │       {}│
 └─────────┘
 """
 
+# ASCII art shown in place of the dealer's face-down card, the same size as a card
+HIDDEN_CARD = """
+┌─────────┐
+│░░░░░░░░░│
+│░░░░░░░░░│
+│░HIDDEN░░│
+│░░░░░░░░░│
+│░░░░░░░░░│
+└─────────┘
+"""
+
+# Rendered art for each (suit, value), filled in the first time each card face is drawn
+_ART_CACHE = {}
+
 # Define a multi-line string for the ASCII art of the game title
 # The 'r' before the string makes it a raw string, treating backslashes as literal characters
 GAME_TITLE = r"""
@@ -33,30 +49,41 @@ GAME_TITLE = r"""
                                              |__/                 
 """
 
+# List all possible suits and values
+SUIT_NAMES = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+VALUE_NAMES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# Blackjack points for each card value; aces count 1 here and may count 11 in a hand
+CARD_POINTS = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
+               'J': 10, 'Q': 10, 'K': 10, 'A': 1}
+
 # Define a class to represent a single playing card
 class Card:
     def __init__(self, suit, value):
         self.suit = suit
         self.value = value
+        self.points = CARD_POINTS[value]  # Precomputed so hand valuation never parses strings
 
     # Define how a card should be represented as a string
     def __str__(self):
         return f"{self.value} of {self.suit}"
 
     # Method to get the ASCII art representation of the card
+    # There are only 52 card faces, so each is formatted once and then reused
     def get_ascii_art(self):
-        return CARD_TEMPLATE.format(self.value.ljust(2), SUITS[self.suit], self.value.rjust(2))
+        key = (self.suit, self.value)
+        art = _ART_CACHE.get(key)
+        if art is None:
+            art = _ART_CACHE[key] = CARD_TEMPLATE.format(self.value.ljust(2), SUITS[self.suit], self.value.rjust(2))
+        return art
 
 # Define a class to represent a deck of cards
 class Deck:
-    def __init__(self):
-        # List all possible suits and values
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        values = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+    def __init__(self, rng=random):
         # Create a list of Card objects for each combination of suit and value
-        self.cards = [Card(suit, value) for suit in suits for value in values]
-        # Shuffle the deck
-        random.shuffle(self.cards)
+        self.cards = [Card(suit, value) for suit in SUIT_NAMES for value in VALUE_NAMES]
+        # Shuffle the deck with the given random source (the random module by default)
+        rng.shuffle(self.cards)
 
     # Method to draw a card from the deck
     def draw(self):
@@ -65,60 +92,122 @@ class Deck:
         else:
             return None
 
+# Shared Card objects for the 52 card ids used by Shoe (id = suit index * 13 + value index),
+# created the first time each one is needed
+_CARD_FACES = [None] * 52
+
+# Function to get the shared Card object for a card id
+def card_for(card_id):
+    card = _CARD_FACES[card_id]
+    if card is None:
+        card = _CARD_FACES[card_id] = Card(SUIT_NAMES[card_id // 13], VALUE_NAMES[card_id % 13])
+    return card
+
+# Blackjack points for each card id, for code that works with ids directly
+CARD_ID_POINTS = array('B', [CARD_POINTS[VALUE_NAMES[i % 13]] for i in range(52)])
+
+# Define a class for a multi-deck shoe stored as a compact array of card ids
+class Shoe:
+    def __init__(self, decks=6, penetration=0.75, rng=random):
+        if not 0 < penetration <= 1:
+            raise ValueError(f"penetration must be in (0, 1], got {penetration}")
+        self.decks = decks
+        self.rng = rng
+        self.card_ids = array('B', range(52)) * decks
+        # The cut card sits this many cards into the shoe; reaching it means a reshuffle is due
+        self.cut = int(len(self.card_ids) * penetration)
+        self.position = 0  # Index of the next card to deal
+        # Optional object told about every card dealt (card_dealt) and every reshuffle (shoe_reshuffled)
+        self.listener = None
+        self.reshuffle()
+
+    # Number of cards left to deal
+    def __len__(self):
+        return len(self.card_ids) - self.position
+
+    # Method to shuffle all cards back into the shoe, in place
+    def reshuffle(self):
+        self.rng.shuffle(self.card_ids)
+        self.position = 0
+        if self.listener is not None:
+            self.listener.shoe_reshuffled()
+
+    # Method to check whether the cut card has come out
+    def needs_reshuffle(self):
+        return self.position >= self.cut
+
+    # Method to deal the next card id, or None if the shoe is empty
+    def draw_id(self):
+        if self.position < len(self.card_ids):
+            card_id = self.card_ids[self.position]
+            self.position += 1
+            if self.listener is not None:
+                self.listener.card_dealt(card_id)
+            return card_id
+        return None
+
+    # Method to deal the next card as a shared Card object, like Deck.draw
+    def draw(self):
+        card_id = self.draw_id()
+        return None if card_id is None else card_for(card_id)
+
 # Define a base class for characters in the game (both player and dealer)
 class Character:
     def __init__(self, name):
         self.name = name
         self.hand = []  # List to hold the character's cards
+        self.hard_total = 0  # Hand total counting every ace as 1, kept up to date on each draw
+        self.aces = 0  # Number of aces in the hand
+
+    # Method to add a card to the character's hand, keeping the hand total up to date
+    def add_card(self, card):
+        self.hand.append(card)
+        self.hard_total += card.points
+        if card.points == 1:
+            self.aces += 1
 
     # Method to draw a card and add it to the character's hand
     def draw(self, deck):
         card = deck.draw()
         if card:
-            self.hand.append(card)
+            self.add_card(card)
         return card
 
-    # Method to calculate the total value of the hand
+    # Method to calculate the total value of the hand in constant time
     def calculate_hand_value(self):
-        value = 0
-        aces = 0
-        for card in self.hand:
-            if card.value in ['J', 'Q', 'K']:
-                value += 10
-            elif card.value == 'A':
-                aces += 1
-            else:
-                value += int(card.value)
-        
-        # Handle aces
-        for _ in range(aces):
-            if value + 11 <= 21:
-                value += 11
-            else:
-                value += 1
-        
-        return value
+        # One ace counts as 11 when that doesn't bust the hand; any others count as 1
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+
+    # Method to check if an ace is currently counted as 11
+    def is_soft(self):
+        return self.aces > 0 and self.hard_total <= 11
 
     # Method to display the character's hand, with an option to hide the first card
     def show_hand(self, hide_first=False):
         if hide_first:
-            return [self.hand[0].get_ascii_art()] + ['[HIDDEN]'] + [card.get_ascii_art() for card in self.hand[2:]]
+            return [self.hand[0].get_ascii_art()] + [HIDDEN_CARD] + [card.get_ascii_art() for card in self.hand[2:]]
         else:
             return [card.get_ascii_art() for card in self.hand]
 
     # Method to clear the character's hand
     def clear_hand(self):
         self.hand = []
+        self.hard_total = 0
+        self.aces = 0
 
 # Define a class for the dealer, inheriting from Character
 class Dealer(Character):
     def __init__(self):
         super().__init__("Dealer")
 
-    # Method to play the dealer's turn
-    def play(self, deck):
+    # Method to play the dealer's turn, optionally calling on_draw(card) after each card drawn
+    def play(self, deck, on_draw=None):
         while self.calculate_hand_value() < 17:
-            self.draw(deck)
+            card = self.draw(deck)
+            if on_draw is not None:
+                on_draw(card)
 
 # Define a class for the player, inheriting from Character
 class Player(Character):
@@ -134,18 +223,25 @@ class Player(Character):
         else:
             return 0
 
-# Function to display the hands of the player and dealer
+# Function to lay out several pieces of card art side by side
+def side_by_side(card_arts):
+    rows = zip(*(art.strip('\n').split('\n') for art in card_arts))
+    return '\n'.join(' '.join(row) for row in rows)
+
+# Function to display the hands of the player and dealer with a single buffered write
 def display_hands(player, dealer, hide_dealer=True):
-    print(f"\n{player.name}'s hand:")
-    for card_art in player.show_hand():
-        print(card_art)
-    print(f"Hand value: {player.calculate_hand_value()}")
-
-    print(f"\nDealer's hand:")
-    for card_art in dealer.show_hand(hide_first=hide_dealer):
-        print(card_art)
+    parts = [
+        f"\n{player.name}'s hand:\n",
+        side_by_side(player.show_hand()),
+        f"\nHand value: {player.calculate_hand_value()}\n",
+        "\nDealer's hand:\n",
+        side_by_side(dealer.show_hand(hide_first=hide_dealer)),
+        "\n",
+    ]
     if not hide_dealer:
-        print(f"Hand value: {dealer.calculate_hand_value()}")
+        parts.append(f"Hand value: {dealer.calculate_hand_value()}\n")
+    sys.stdout.write(''.join(parts))
+    sys.stdout.flush()
 
 # Function to play a single round of the game
 def play_round(dealer, player, deck):
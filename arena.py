@@ -0,0 +1,176 @@
+"""Many-vs-many arena mode for python_rpg.
+
+Any number of teams of Character objects fight at once. A priority queue keyed
+by initiative orders the turns, and each team keeps an index of its living
+members so picking a target never scans the dead. A turn costs O(log n), so
+arenas with 100k combatants are practical. Target selection is a pluggable
+strategy.
+"""
+import heapq
+import random
+from collections import namedtuple
+
+from python_rpg import Hero, Goblin, Shadow, Zombie, Wizard, Archer
+
+# Outcome of an arena battle
+ArenaResult = namedtuple("ArenaResult", "winner turns survivors kills")
+
+
+class LivingIndex:
+    """Set of living combatant ids with O(1) add, remove and random pick."""
+    __slots__ = ("members", "positions")
+
+    def __init__(self):
+        self.members = []  # Combatant ids in no particular order
+        self.positions = {}  # Combatant id -> position in members
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, index):
+        return index in self.positions
+
+    def add(self, index):
+        """Add a combatant id."""
+        self.positions[index] = len(self.members)
+        self.members.append(index)
+
+    def remove(self, index):
+        """Remove a combatant id by swapping the last member into its slot."""
+        position = self.positions.pop(index)
+        last = self.members.pop()
+        if last != index:
+            self.members[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng):
+        """Return a random living combatant id."""
+        return self.members[int(rng.random() * len(self.members))]
+
+
+class RandomTarget:
+    """Attack a uniformly random living opponent."""
+
+    def setup(self, arena):
+        """Prepare any per-arena state (none needed)."""
+
+    def on_damage(self, arena, index):
+        """React to a combatant's health changing (nothing to do)."""
+
+    def select(self, arena, attacker, team):
+        """Return the id of the target on the given opposing team."""
+        return arena.living[team].choice(arena.rng)
+
+
+class WeakestTarget:
+    """Attack the living opponent with the least health, tracked by a lazy heap per team."""
+
+    def setup(self, arena):
+        """Build a (health, id) heap for every team."""
+        self.heaps = {}
+        for team, members in arena.living.items():
+            heap = [(arena.combatants[i].health, i) for i in members.members]
+            heapq.heapify(heap)
+            self.heaps[team] = heap
+
+    def on_damage(self, arena, index):
+        """Record a combatant's new health; older heap entries become stale."""
+        heapq.heappush(self.heaps[arena.team_of[index]], (arena.combatants[index].health, index))
+
+    def select(self, arena, attacker, team):
+        """Return the weakest living member of the team, discarding stale heap entries."""
+        heap = self.heaps[team]
+        living = arena.living[team]
+        while True:
+            health, index = heap[0]
+            if index in living and arena.combatants[index].health == health:
+                return index
+            heapq.heappop(heap)
+
+
+class Arena:
+    def __init__(self, teams, strategy=None, rng=random):
+        """Set up a battle between teams, given as a dict of team name to a list of characters."""
+        self.rng = rng
+        self.strategy = RandomTarget() if strategy is None else strategy
+        self.combatants = []  # Every character in the arena, by combatant id
+        self.team_of = []  # Team name of each combatant
+        self.living = {}  # Team name -> LivingIndex of members still alive
+        self.kills = {}  # Team name -> number of opponents defeated
+        self.queue = []  # Heap of (next turn time, combatant id)
+        for team, members in teams.items():
+            self.living[team] = LivingIndex()
+            self.kills[team] = 0
+            for character in members:
+                index = len(self.combatants)
+                self.combatants.append(character)
+                self.team_of.append(team)
+                if character.alive():
+                    self.living[team].add(index)
+                    self.queue.append((rng.random(), index))  # Initiative roll
+        heapq.heapify(self.queue)
+        self.strategy.setup(self)
+
+    def opponents(self, team):
+        """Return a random opposing team that still has living members, or None."""
+        teams = [other for other, members in self.living.items() if other != team and members]
+        if not teams:
+            return None
+        return teams[0] if len(teams) == 1 else teams[int(self.rng.random() * len(teams))]
+
+    def step(self):
+        """Give the next combatant its turn. Return False once only one team is left standing."""
+        queue = self.queue
+        while queue:
+            time, index = heapq.heappop(queue)
+            team = self.team_of[index]
+            if index in self.living[team]:
+                break
+        else:
+            return False  # Everyone is dead
+        enemy_team = self.opponents(team)
+        if enemy_team is None:
+            heapq.heappush(queue, (time, index))
+            return False
+
+        attacker = self.combatants[index]
+        target_index = self.strategy.select(self, attacker, enemy_team)
+        target = self.combatants[target_index]
+        attacker.attack(target)
+        self.strategy.on_damage(self, target_index)
+        if not target.alive():
+            self.living[enemy_team].remove(target_index)
+            self.kills[team] += 1
+        heapq.heappush(queue, (time + 1.0, index))  # Act again one round later
+        return True
+
+    def run(self, max_turns=None):
+        """Fight until one team remains or max_turns is reached and return an ArenaResult."""
+        turns = 0
+        while turns != max_turns and self.step():
+            turns += 1
+        standing = [team for team, members in self.living.items() if members]
+        winner = standing[0] if len(standing) == 1 else None
+        survivors = {team: len(members) for team, members in self.living.items()}
+        return ArenaResult(winner, turns, survivors, dict(self.kills))
+
+
+def random_teams(heroes, enemies, rng=random):
+    """Return a heroes-vs-enemies team dict with enemies drawn evenly from the enemy classes."""
+    kinds = (Goblin, Shadow, Zombie, Wizard, Archer)
+    return {
+        "heroes": [Hero(f"Hero {i + 1}") for i in range(heroes)],
+        "enemies": [rng.choice(kinds)() for _ in range(enemies)],
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    for strategy in (RandomTarget(), WeakestTarget()):
+        arena = Arena(random_teams(50_000, 50_000), strategy)
+        start = time.perf_counter()
+        result = arena.run()
+        elapsed = time.perf_counter() - start
+        print(f"{type(strategy).__name__}: {result.winner} win after {result.turns:,} turns, "
+              f"survivors {result.survivors} ({result.turns / elapsed:,.0f} turns/s)")
@@ -0,0 +1,138 @@
+"""Vectorized Blackjack bankroll and risk-of-ruin simulator.
+
+Blackjack.main() starts a Player with 1000 gold and plays rounds until the
+gold runs out. A winning bet is paid twice over, a push returns the bet, and
+a loss keeps it, so each round changes the gold by +bet, 0 or -bet. This
+module runs hundreds of thousands of such bankrolls in lockstep as NumPy
+arrays. Each round's outcome is drawn from a RoundOdds distribution, which
+round_odds() measures once by batched headless play with a hit/stand strategy.
+A betting system then decides every session's next bet from its gold and last
+result.
+
+Rounds are treated as independent draws from that distribution, so effects
+of the deck running down between reshuffles are averaged out. Blackjack.main
+refuses bets above the player's gold. Here a session that cannot cover its
+system's bet stakes everything it has left instead.
+"""
+from collections import namedtuple
+from functools import partial
+
+import numpy as np
+
+from blackjack_engine import WIN, DEALER_BUST, PUSH, LOSS, BUST, ThresholdStrategy
+from parallel import blackjack_rounds, run_parallel
+
+# Chances of a round winning (including dealer busts), pushing and losing (including player busts)
+RoundOdds = namedtuple("RoundOdds", "win push loss")
+
+# Outcome of a batch of sessions: per-session final gold and the round each went broke on (0 if it never did)
+BankrollResult = namedtuple("BankrollResult", "sessions rounds starting_gold final_gold ruin_round reached_goal")
+
+
+def round_odds(strategy=None, rounds=1_000_000, seed=0, workers=None):
+    """Measure the RoundOdds of a hit/stand strategy by playing rounds with blackjack_engine."""
+    strategy = ThresholdStrategy() if strategy is None else strategy
+    totals = run_parallel(partial(blackjack_rounds, strategy=strategy), rounds, seed=seed, workers=workers)
+    played = totals["rounds"]
+    return RoundOdds((totals[WIN] + totals[DEALER_BUST]) / played, totals[PUSH] / played,
+                     (totals[LOSS] + totals[BUST]) / played)
+
+
+class FlatBet:
+    """Bet the same amount every round."""
+
+    def __init__(self, amount=10):
+        self.amount = amount
+
+    def bets(self, gold, last_bet, last_net):
+        """Return each session's next bet, given its gold and its last bet and result (-1, 0 or +1)."""
+        return np.full_like(gold, self.amount)
+
+
+class Martingale:
+    """Start at a base bet, double it after every loss and go back to the base after a win."""
+
+    def __init__(self, base=10):
+        self.base = base
+
+    def bets(self, gold, last_bet, last_net):
+        return np.where(last_net < 0, last_bet * 2, np.where(last_net > 0, self.base, last_bet))
+
+
+class Proportional:
+    """Bet a fixed fraction of the current gold, at least 1."""
+
+    def __init__(self, fraction=0.02):
+        self.fraction = fraction
+
+    def bets(self, gold, last_bet, last_net):
+        return np.maximum(1, (gold * self.fraction).astype(gold.dtype))
+
+
+def simulate(sessions, system, odds, rounds=1000, starting_gold=1000, goal=None, seed=None):
+    """Play up to rounds rounds in each of many independent sessions and return a BankrollResult.
+
+    A session stops when its gold reaches 0, or reaches goal if one is given.
+    Only sessions still playing are stepped, so the work shrinks as they end.
+    """
+    rng = np.random.default_rng(seed)
+    final_gold = np.empty(sessions, dtype=np.int64)
+    ruin_round = np.zeros(sessions, dtype=np.int32)
+    reached_goal = 0
+
+    active = np.arange(sessions)
+    gold = np.full(sessions, starting_gold, dtype=np.int64)
+    last_bet = np.zeros(sessions, dtype=np.int64)
+    last_net = np.ones(sessions, dtype=np.int8)  # Every session starts as if it had just won
+    win_below, lose_from = odds.win, odds.win + odds.push
+    for round_number in range(1, rounds + 1):
+        bet = np.minimum(system.bets(gold, last_bet, last_net), gold)
+        draw = rng.random(len(active))
+        net = (draw < win_below).astype(np.int8) - (draw >= lose_from)
+        gold += net * bet
+        last_bet, last_net = bet, net
+
+        broke = gold <= 0
+        done = broke if goal is None else broke | (gold >= goal)
+        if done.any():
+            ruin_round[active[broke]] = round_number
+            reached_goal += int(np.count_nonzero(done)) - int(np.count_nonzero(broke))
+            final_gold[active[done]] = gold[done]
+            keep = ~done
+            active, gold, last_bet, last_net = active[keep], gold[keep], last_bet[keep], last_net[keep]
+            if not len(active):
+                break
+    final_gold[active] = gold
+    return BankrollResult(sessions, rounds, starting_gold, final_gold, ruin_round, reached_goal)
+
+
+def risk_of_ruin(result):
+    """Return the fraction of sessions that went broke."""
+    return np.count_nonzero(result.ruin_round) / result.sessions
+
+
+def report(result):
+    """Return a text summary of ruin risk, time to ruin and the final gold distribution."""
+    ruined = result.ruin_round[result.ruin_round > 0]
+    lines = [f"{result.sessions:,} sessions of up to {result.rounds:,} rounds from {result.starting_gold} gold: "
+             f"risk of ruin {risk_of_ruin(result):.4f}, reached goal {result.reached_goal / result.sessions:.4f}"]
+    if len(ruined):
+        p10, p50, p90 = np.percentile(ruined, (10, 50, 90))
+        lines.append(f"  Rounds to ruin: mean {ruined.mean():.1f}, p10 {p10:.0f}, median {p50:.0f}, p90 {p90:.0f}")
+    quantiles = np.percentile(result.final_gold, (1, 10, 50, 90, 99))
+    lines.append(f"  Final gold: mean {result.final_gold.mean():.1f}, "
+                 + ", ".join(f"p{q} {v:.0f}" for q, v in zip((1, 10, 50, 90, 99), quantiles)))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    odds = round_odds()
+    print(f"Hit below 17: win {odds.win:.4f}, push {odds.push:.4f}, loss {odds.loss:.4f} "
+          f"({time.perf_counter() - start:.1f}s to measure)")
+    for system in (FlatBet(10), FlatBet(100), Martingale(10), Proportional(0.05)):
+        start = time.perf_counter()
+        result = simulate(200_000, system, odds, rounds=1000, goal=2000, seed=1)
+        print(f"\n{type(system).__name__} {vars(system)} ({time.perf_counter() - start:.1f}s)\n{report(result)}")
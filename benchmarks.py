@@ -0,0 +1,158 @@
+"""Benchmarks for the hot paths of python_rpg and Blackjack, with regression checks.
+
+Each benchmark runs a batch of operations with a seeded random stream. The
+batch grows until one run takes at least min_time seconds, and the best of
+several repeats is reported as operations per second. Results are written as
+JSON. --compare checks them against a saved baseline and exits with status 1
+if any benchmark got slower by more than the tolerance.
+
+    python benchmarks.py --output baseline.json
+    python benchmarks.py --compare baseline.json --tolerance 0.1
+
+Only the standard library and the game modules are used, so it runs offline.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from python_rpg import Hero, Goblin, Shadow, Zombie, Wizard, Archer, AlwaysAttack, run_fight
+from Blackjack import SUIT_NAMES, VALUE_NAMES, Card, Deck, Player, side_by_side
+from blackjack_engine import RoundEngine, ThresholdStrategy
+
+FORMAT = 1  # Version of the results file layout
+
+
+def _fights(cls):
+    """Return a benchmark of fresh Hero versus fresh cls fights."""
+    def bench(n, rng):
+        policy = AlwaysAttack()
+        for _ in range(n):
+            hero = Hero()
+            enemy = cls()
+            hero.rng = enemy.rng = rng
+            run_fight(hero, enemy, policy)
+    return bench
+
+
+def bench_hand_value(n, rng):
+    """calculate_hand_value() on a soft three-card hand."""
+    player = Player("Player", 0)
+    for value in ("A", "6", "3"):
+        player.add_card(Card(rng.choice(SUIT_NAMES), value))
+    value = player.calculate_hand_value
+    for _ in range(n):
+        value()
+
+
+def bench_deck(n, rng):
+    """Build and shuffle a 52-card Deck."""
+    for _ in range(n):
+        Deck(rng)
+
+
+def bench_ascii_art(n, rng):
+    """Render a five-card hand as side-by-side ASCII art."""
+    cards = [Card(rng.choice(SUIT_NAMES), rng.choice(VALUE_NAMES)) for _ in range(5)]
+    for _ in range(n):
+        side_by_side([card.get_ascii_art() for card in cards])
+
+
+def bench_blackjack_round(n, rng):
+    """Play a full headless round with a fixed bet and hit-below-17 strategy."""
+    engine = RoundEngine(Player("Player", 10 ** 12), rng=rng)
+    strategy = ThresholdStrategy()
+    play = engine.play_round
+    for _ in range(n):
+        play(strategy)
+
+
+BENCHMARKS = {f"fight:{cls.__name__}": _fights(cls) for cls in (Goblin, Shadow, Zombie, Wizard, Archer)}
+BENCHMARKS.update({
+    "hand_value": bench_hand_value,
+    "deck": bench_deck,
+    "ascii_art": bench_ascii_art,
+    "blackjack_round": bench_blackjack_round,
+})
+
+
+def measure(bench, min_time=0.2, repeat=5, seed=0):
+    """Return the best operations per second of a benchmark over several timed runs."""
+    n = 1
+    while True:  # Grow the batch until one run is long enough to time reliably
+        start = time.perf_counter()
+        bench(n, random.Random(seed))
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        n = n * 10 if elapsed < min_time / 10 else int(n * min_time / elapsed * 1.1) + 1
+    best = elapsed
+    for run in range(1, repeat):
+        start = time.perf_counter()
+        bench(n, random.Random(seed + run))
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def run(names=None, min_time=0.2, repeat=5):
+    """Run the named benchmarks (all by default) and return the results document."""
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if names is None or name in names:
+            results[name] = measure(bench, min_time, repeat)
+    return {
+        "format": FORMAT,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "ops_per_sec": results,
+    }
+
+
+def compare(current, baseline, tolerance=0.1):
+    """Return (name, baseline ops/s, current ops/s, ratio, regressed) for benchmarks present in both runs."""
+    rows = []
+    for name, now in current["ops_per_sec"].items():
+        before = baseline["ops_per_sec"].get(name)
+        if before:
+            ratio = now / before
+            rows.append((name, before, now, ratio, ratio < 1 - tolerance))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a saved results file")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown before flagging (default 0.1)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark; the best is kept")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default all): {', '.join(BENCHMARKS)}")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    current = run(args.names or None, args.min_time, args.repeat)
+    for name, ops in current["ops_per_sec"].items():
+        print(f"{name:<16} {ops:>14,.0f} ops/s")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = 0
+        print(f"\nAgainst {args.compare} (tolerance {args.tolerance:.0%}):")
+        for name, before, now, ratio, regressed in compare(current, baseline, args.tolerance):
+            regressions += regressed
+            print(f"{name:<16} {before:>14,.0f} -> {now:>14,.0f}  {ratio - 1:+7.1%}{'  REGRESSION' if regressed else ''}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
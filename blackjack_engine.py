@@ -0,0 +1,168 @@
+"""Headless Blackjack round engine.
+
+Plays rounds with the Deck, Dealer and Player classes from Blackjack.py and no
+console I/O. The bet and every hit/stand decision come from a strategy
+object, and each round returns a compact RoundResult record.
+"""
+import random
+from collections import namedtuple
+from functools import partial
+
+from Blackjack import Deck, Shoe, Dealer, Player
+
+# Round outcomes
+WIN = "win"
+DEALER_BUST = "dealer_bust"
+LOSS = "loss"
+BUST = "bust"
+PUSH = "push"
+NO_BET = "no_bet"
+
+# Cards a round rarely goes past; a shoe with fewer left is reshuffled before the deal even if the cut card is still in
+ROUND_CARDS = 12
+
+# Summary of one round: payout is the gold returned to the player (2x bet on a win, the bet on a push)
+RoundResult = namedtuple("RoundResult", "bet outcome player_value dealer_value payout")
+
+
+class ThresholdStrategy:
+    """Bet a fixed amount and hit until the hand reaches a threshold, like the dealer does at 17."""
+
+    def __init__(self, stand_on=17, bet=10):
+        self.stand_on = stand_on
+        self.amount = bet
+
+    def bet(self, player):
+        """Return the amount to bet this round."""
+        return self.amount
+
+    def hit(self, player, dealer_up):
+        """Return True to hit, given the player and the dealer's visible card."""
+        return player.calculate_hand_value() < self.stand_on
+
+
+class RoundEngine:
+    def __init__(self, player=None, dealer=None, rng=random, reshuffle_below=20, shoe=None):
+        """Set up a table.
+
+        With a Shoe, cards are reshuffled in place once the cut card comes out.
+        Otherwise a single Deck is replaced once it runs below reshuffle_below
+        cards, as in main().
+        """
+        self.player = Player("Player", 1000) if player is None else player
+        self.dealer = Dealer() if dealer is None else dealer
+        self.rng = rng
+        self.reshuffle_below = reshuffle_below
+        self.shoe = shoe
+        self.deck = Deck(rng) if shoe is None else shoe
+        self.bet = 0  # Bet riding on the current round
+        self.observer = None  # Optional callable(event, character, *args) told about deals, hits, busts and payouts
+
+    def emit(self, event, character, *args):
+        """Report a round event to the attached observer, if there is one."""
+        if self.observer is not None:
+            self.observer(event, character, *args)
+
+    def begin_round(self, amount):
+        """Take the bet and make the initial deal. Return the bet placed, or 0 if the player can't cover it."""
+        if self.shoe is not None:
+            if self.shoe.needs_reshuffle() or len(self.shoe) < ROUND_CARDS:
+                self.shoe.reshuffle()
+        elif len(self.deck.cards) < self.reshuffle_below:
+            self.deck = Deck(self.rng)
+        player, dealer = self.player, self.dealer
+
+        self.bet = player.place_bet(amount)
+        if self.bet == 0:
+            return 0
+
+        # Clear hands and make the initial deal
+        player.clear_hand()
+        dealer.clear_hand()
+        for _ in range(2):
+            self.emit("deal", player, player.draw(self))
+            self.emit("deal", dealer, dealer.draw(self))
+        return self.bet
+
+    def draw(self):
+        """Deal the next card; the engine stands in for the deck when characters draw.
+
+        If the cards run out mid-round, a Shoe is reshuffled (cards already in
+        hands go back in with the rest) and a Deck is replaced with a new one,
+        so a draw never comes up empty.
+        """
+        card = self.deck.draw()
+        if card is None:
+            if self.shoe is not None:
+                self.shoe.reshuffle()
+            else:
+                self.deck = Deck(self.rng)
+            card = self.deck.draw()
+        return card
+
+    def hit(self):
+        """Draw a card for the player and return it."""
+        card = self.player.draw(self)
+        self.emit("hit", self.player, card)
+        return card
+
+    def busted(self):
+        """Return the RoundResult for a player who has gone over 21."""
+        result = RoundResult(self.bet, BUST, self.player.calculate_hand_value(), self.dealer.calculate_hand_value(), 0)
+        self.emit("bust", self.player, result)
+        return result
+
+    def settle(self):
+        """Play the dealer's turn, pay the player and return the RoundResult."""
+        self.emit("stand", self.player)
+        dealer = self.dealer
+        dealer.play(self, None if self.observer is None else partial(self.observer, "dealer_draw", dealer))
+        bet = self.bet
+        player_value = self.player.calculate_hand_value()
+        dealer_value = dealer.calculate_hand_value()
+        if dealer_value > 21:
+            outcome, payout = DEALER_BUST, bet * 2
+        elif player_value > dealer_value:
+            outcome, payout = WIN, bet * 2
+        elif player_value < dealer_value:
+            outcome, payout = LOSS, 0
+        else:
+            outcome, payout = PUSH, bet
+        self.player.gold += payout
+        result = RoundResult(bet, outcome, player_value, dealer_value, payout)
+        self.emit("payout", self.player, result)
+        return result
+
+    def play_round(self, strategy):
+        """Play one round with the strategy's bet and decisions and return a RoundResult."""
+        player = self.player
+        if not self.begin_round(strategy.bet(player)):
+            return RoundResult(0, NO_BET, 0, 0, 0)
+
+        # Player's turn; the dealer's first card is the one shown face up
+        dealer_up = self.dealer.hand[0]
+        while strategy.hit(player, dealer_up):
+            self.hit()
+            if player.calculate_hand_value() > 21:
+                return self.busted()
+        return self.settle()
+
+    def play_rounds(self, strategy, rounds):
+        """Yield RoundResults for up to the given number of rounds, stopping if the player goes broke."""
+        for _ in range(rounds):
+            if self.player.gold <= 0:
+                return
+            yield self.play_round(strategy)
+
+
+if __name__ == "__main__":
+    import time
+    from collections import Counter
+
+    rounds = 500_000
+    for label, shoe in (("single deck", None), ("6-deck shoe", Shoe(6))):
+        engine = RoundEngine(Player("Player", 10 ** 9), shoe=shoe)
+        start = time.perf_counter()
+        outcomes = Counter(result.outcome for result in engine.play_rounds(ThresholdStrategy(), rounds))
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {dict(outcomes)} ({rounds / elapsed * 60:,.0f} rounds/minute)")
@@ -0,0 +1,144 @@
+"""Asyncio server hosting many concurrent Blackjack tables over a line protocol.
+
+Every connection gets its own table: a Player, a Dealer and a Shoe with its
+own random stream, driven by blackjack_engine.RoundEngine. Bets and hit/stand
+decisions arrive as text lines instead of input(). Each table runs in its own
+coroutine, every write waits for the socket to drain, and a slow or silent
+client only holds up its own table until the idle timeout.
+
+Protocol (one UTF-8 line per message):
+
+    server: WELCOME <gold>          client: BET <amount>
+    server: BET?                    client: HIT | STAND
+    server: HAND <cards> = <value>  client: QUIT
+    server: DEALER <cards>
+    server: ACTION?
+    server: RESULT <outcome> <payout> <gold>
+    server: ERROR <message>
+    server: BYE <gold>
+
+Cards are written like 10♠ or A♥; the dealer's face-down card is written as ??.
+"""
+import asyncio
+import random
+
+from Blackjack import SUITS, Shoe, Player
+from blackjack_engine import RoundEngine
+from line_server import LineServer, run
+
+
+def card_text(card):
+    """Return the short protocol form of a card, e.g. Q♦."""
+    return f"{card.value}{SUITS[card.suit]}"
+
+
+class BlackjackServer(LineServer):
+    def __init__(self, max_tables=1000, decks=6, starting_gold=1000, idle_timeout=300.0, seed=None):
+        """Configure the server; seed makes every table's shoe reproducible."""
+        self.max_tables = max_tables
+        self.decks = decks
+        self.starting_gold = starting_gold
+        self.idle_timeout = idle_timeout
+        self.seeds = random.Random(seed)  # Hands out an independent seed to each table
+        self.tables = 0  # Tables currently open
+
+    async def handle(self, reader, writer):
+        """Serve one connection as one table, refusing it if the server is full."""
+        try:
+            if self.tables >= self.max_tables:
+                await self.send(writer, "ERROR server full")
+                return
+            self.tables += 1
+            try:
+                await self.play_table(reader, writer)
+            finally:
+                self.tables -= 1
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client went away; its table simply closes
+        finally:
+            writer.close()
+
+    async def send(self, writer, line):
+        """Write a line and wait until the transport can take more (backpressure)."""
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+
+    async def receive(self, reader):
+        """Return the next command as a list of upper-case words, or None on disconnect or idle timeout."""
+        try:
+            line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            return None
+        except ValueError:
+            return None  # A line longer than the stream limit; drop the client as if it disconnected
+        if not line:
+            return None
+        words = line.decode(errors="replace").split()
+        return [words[0].upper()] + words[1:] if words else [""]
+
+    def parse_bet(self, command):
+        """Return the amount of a BET command, or None unless it is a positive whole number."""
+        if command[0] != "BET" or len(command) != 2:
+            return None
+        try:
+            amount = int(command[1])
+        except ValueError:
+            return None
+        return amount if amount > 0 else None
+
+    async def play_table(self, reader, writer):
+        """Run rounds for one client until it quits, disconnects or runs out of gold."""
+        engine = RoundEngine(Player("Player", self.starting_gold),
+                             shoe=Shoe(self.decks, rng=random.Random(self.seeds.random())))
+        player, dealer = engine.player, engine.dealer
+        await self.send(writer, f"WELCOME {player.gold}")
+
+        while player.gold > 0:
+            await self.send(writer, "BET?")
+            command = await self.receive(reader)
+            if command is None or command[0] == "QUIT":
+                break
+            amount = self.parse_bet(command)
+            if amount is None:
+                await self.send(writer, "ERROR expected BET <amount>")
+                continue
+            if not engine.begin_round(amount):
+                await self.send(writer, "ERROR not enough gold")
+                continue
+
+            await self.send_hands(writer, engine)
+            result = None
+            while result is None:
+                await self.send(writer, "ACTION?")
+                command = await self.receive(reader)
+                if command is None:
+                    return  # Leaving mid-round forfeits the bet
+                if command[0] == "HIT":
+                    engine.hit()
+                    await self.send_hands(writer, engine)
+                    if player.calculate_hand_value() > 21:
+                        result = engine.busted()
+                elif command[0] == "STAND":
+                    result = engine.settle()
+                else:
+                    await self.send(writer, "ERROR expected HIT or STAND")
+            await self.send(writer, f"DEALER {' '.join(card_text(card) for card in dealer.hand)}")
+            await self.send(writer, f"RESULT {result.outcome} {result.payout} {player.gold}")
+
+        await self.send(writer, f"BYE {player.gold}")
+
+    async def send_hands(self, writer, engine):
+        """Send the player's hand and the dealer's face-up card."""
+        player, dealer = engine.player, engine.dealer
+        cards = " ".join(card_text(card) for card in player.hand)
+        await self.send(writer, f"HAND {cards} = {player.calculate_hand_value()}")
+        await self.send(writer, f"DEALER {card_text(dealer.hand[0])} ??")
+
+
+async def serve(host="127.0.0.1", port=8021, path=None, **options):
+    """Run a BlackjackServer until cancelled."""
+    await BlackjackServer(**options).serve(host, port, path)
+
+
+if __name__ == "__main__":
+    run(BlackjackServer(), 8021, "Blackjack tables")
@@ -0,0 +1,147 @@
+"""Exact dealer-outcome and basic-strategy tables for Blackjack.py.
+
+The dealer in Blackjack.py draws until the hand is worth at least 17 and
+stands on every 17, soft or hard. dealer_probabilities() computes the exact
+distribution of the dealer's final total by memoized recursion over the
+remaining shoe composition. basic_strategy() turns those distributions into an
+expected-value-maximizing hit/stand table keyed by (player total, soft, dealer
+up card). The tables are computed once per shoe size and cached, so a strategy
+lookup is a single dict access.
+
+A shoe composition is a tuple of 10 card counts indexed by points - 1: aces
+first, then 2 to 9, then every ten-valued card.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from blackjack_engine import ThresholdStrategy
+
+# Final dealer results, in the order used by every outcome distribution
+DEALER_TOTALS = (17, 18, 19, 20, 21)
+BUST_INDEX = len(DEALER_TOTALS)
+
+# One cell of the strategy table
+Decision = namedtuple("Decision", "hit stand_ev hit_ev")
+
+
+def shoe_composition(decks):
+    """Return the composition of a full shoe with the given number of decks."""
+    return (4 * decks,) * 9 + (16 * decks,)
+
+
+def hand_value(hard_total, has_ace):
+    """Return a hand's value the way Character.calculate_hand_value counts it."""
+    return hard_total + 10 if has_ace and hard_total <= 11 else hard_total
+
+
+@lru_cache(maxsize=1 << 20)
+def dealer_probabilities(composition, hard_total, has_ace):
+    """Return the probabilities of the dealer finishing on 17-21 or busting, from a partial hand."""
+    value = hand_value(hard_total, has_ace)
+    if value >= 17:
+        result = [0.0] * (BUST_INDEX + 1)
+        result[BUST_INDEX if value > 21 else value - 17] = 1.0
+        return tuple(result)
+
+    result = [0.0] * (BUST_INDEX + 1)
+    remaining = sum(composition)
+    for index, count in enumerate(composition):
+        if count:
+            points = index + 1
+            chance = count / remaining
+            next_hard = hard_total + points
+            next_ace = has_ace or points == 1
+            next_value = hand_value(next_hard, next_ace)
+            if next_value > 21:
+                result[BUST_INDEX] += chance  # Settle finished hands here instead of recursing
+            elif next_value >= 17:
+                result[next_value - 17] += chance
+            else:
+                drawn = composition[:index] + (count - 1,) + composition[index + 1:]
+                for i, p in enumerate(dealer_probabilities(drawn, next_hard, next_ace)):
+                    result[i] += chance * p
+    return tuple(result)
+
+
+def remove_card(composition, points):
+    """Return the composition with one card of the given points taken out."""
+    index = points - 1
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+@lru_cache(maxsize=None)
+def dealer_table(decks=6):
+    """Return a dict of dealer up card points (1 for an ace) to final-total probabilities for a fresh shoe."""
+    full = shoe_composition(decks)
+    return {up: dealer_probabilities(remove_card(full, up), up, up == 1) for up in range(1, 11)}
+
+
+def stand_ev(total, outcomes):
+    """Return the expected net result per unit bet of standing on total against a dealer distribution."""
+    ev = outcomes[BUST_INDEX]
+    for dealer_total, p in zip(DEALER_TOTALS, outcomes):
+        if total > dealer_total:
+            ev += p
+        elif total < dealer_total:
+            ev -= p
+    return ev
+
+
+@lru_cache(maxsize=None)
+def basic_strategy(decks=6):
+    """Return the hit/stand table as a dict of (player total, soft, dealer up points) to Decision.
+
+    Dealer outcomes are exact for the shoe minus the up card. The player's own
+    draws are taken from that same composition, so the table depends only on
+    the player's total and not on which cards make it up.
+    """
+    full = shoe_composition(decks)
+    table = {}
+    for up, outcomes in dealer_table(decks).items():
+        composition = remove_card(full, up)
+        remaining = sum(composition)
+        draws = [(index + 1, count / remaining) for index, count in enumerate(composition) if count]
+        best = {}  # (hard total, has ace) -> best EV, filled from high totals down
+
+        def best_ev(hard_total, has_ace):
+            value = hand_value(hard_total, has_ace)
+            if value > 21:
+                return -1.0
+            key = (hard_total, has_ace)
+            if key not in best:
+                standing = stand_ev(value, outcomes)
+                hitting = sum(p * best_ev(hard_total + points, has_ace or points == 1) for points, p in draws)
+                best[key] = max(standing, hitting)
+                table[(value, value != hard_total, up)] = Decision(hitting > standing, standing, hitting)
+            return best[key]
+
+        for hard_total in range(2, 22):
+            for has_ace in (False, True):
+                best_ev(hard_total, has_ace)
+    return table
+
+
+class BasicStrategy(ThresholdStrategy):
+    """Bet a fixed amount and hit or stand by the precomputed basic-strategy table."""
+
+    def __init__(self, decks=6, bet=10):
+        super().__init__(bet=bet)
+        self.table = basic_strategy(decks)
+
+    def hit(self, player, dealer_up):
+        """Look up the decision for the player's total, softness and the dealer's up card."""
+        decision = self.table.get((player.calculate_hand_value(), player.is_soft(), dealer_up.points))
+        return decision is not None and decision.hit
+
+
+if __name__ == "__main__":
+    names = {1: "A", 10: "T"}
+    print("Dealer final-total probabilities (6 decks):")
+    for up, outcomes in dealer_table(6).items():
+        print(f"  {names.get(up, up):>2}: " + " ".join(f"{p:.4f}" for p in outcomes))
+    table = basic_strategy(6)
+    for soft in (False, True):
+        print("Soft totals:" if soft else "Hard totals:")
+        for total in range(12 if soft else 4, 22):
+            row = "".join("H" if table[(total, soft, up)].hit else "S" for up in (*range(2, 11), 1))
+            print(f"  {total:>2}: {row}")
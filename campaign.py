@@ -0,0 +1,255 @@
+"""Headless full-campaign simulator for python_rpg with streaming statistics.
+
+run_campaign() plays the loop from python_rpg.main() with no console. Before
+each fight the Hero shops at the Store and uses items, following a scripted
+ShoppingPolicy. Then it fights a pooled random enemy under a battle policy,
+and it keeps going until it dies or reaches a fight limit.
+
+campaigns() plays a batch of campaigns into a CampaignStats, and run_parallel
+can spread a batch across processes. CampaignStats keeps only bounded-memory
+aggregates. Histograms count values in fixed-width bins. QuantileSketches
+keep log-spaced buckets with a fixed relative error, as in DDSketch. Both
+merge exactly, so per-chunk stats combine into the same totals in any order.
+"""
+import math
+from collections import Counter, namedtuple
+
+from python_rpg import Hero, Store, AlwaysAttack, EnemyFactory, run_fight
+
+
+class Histogram:
+    """Counts of values in fixed-width bins; merging adds the counts."""
+    __slots__ = ("width", "bins")
+
+    def __init__(self, width=1):
+        self.width = width
+        self.bins = Counter()  # Bin number -> values counted in [number * width, (number + 1) * width)
+
+    def add(self, value, count=1):
+        self.bins[value // self.width] += count
+
+    def update(self, other):
+        """Merge another histogram with the same bin width into this one."""
+        if other.width != self.width:
+            raise ValueError("Cannot merge histograms with different bin widths")
+        self.bins.update(other.bins)
+
+    @property
+    def count(self):
+        return sum(self.bins.values())
+
+    def items(self):
+        """Return (bin start, count) pairs in increasing order."""
+        return [(number * self.width, count) for number, count in sorted(self.bins.items())]
+
+
+class QuantileSketch:
+    """Streaming quantiles of non-negative values, each within a relative accuracy of the true value.
+
+    Values go into buckets spaced by a factor gamma, so memory grows with the
+    logarithm of the value range rather than with the number of values.
+    """
+    __slots__ = ("accuracy", "log_gamma", "buckets", "zeros", "count", "total", "min", "max")
+
+    def __init__(self, accuracy=0.01):
+        self.accuracy = accuracy
+        self.log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self.buckets = Counter()  # Bucket index -> values in (gamma ** (index - 1), gamma ** index]
+        self.zeros = 0
+        self.count = 0
+        self.total = 0  # Sum of the values, for the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, count=1):
+        if value < 0:
+            raise ValueError("QuantileSketch only takes non-negative values")
+        if value == 0:
+            self.zeros += count
+        else:
+            self.buckets[math.ceil(math.log(value) / self.log_gamma)] += count
+        self.count += count
+        self.total += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, other):
+        """Merge another sketch with the same accuracy into this one."""
+        if other.accuracy != self.accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else math.nan
+
+    def quantile(self, q):
+        """Return the value at quantile q (0 to 1)."""
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        gamma = math.exp(self.log_gamma)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                value = 2 * gamma ** index / (gamma + 1)  # Middle of the bucket in relative terms
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+# Outcome of one campaign; bought and used are Counters of item names
+CampaignResult = namedtuple("CampaignResult", "fights wins turns coins_earned coins_spent final_coins bought used killer")
+
+
+class ShoppingPolicy:
+    def __init__(self, stock=None, heal_below=10, use_swords=False, battle=None):
+        """Script the Hero's choices between fights.
+
+        stock maps item names to how many to keep in the inventory; the Hero
+        buys them, in Store order, whenever it has the coins. A Tonic is used
+        when health falls below heal_below, and with use_swords every Sword is
+        used as soon as it is bought (using a Sword applies it a second time).
+        battle is the battle policy for fights, AlwaysAttack by default.
+        """
+        self.stock = {"Tonic": 2, "Sword": 1} if stock is None else stock
+        self.heal_below = heal_below
+        self.use_swords = use_swords
+        self.battle = AlwaysAttack() if battle is None else battle
+
+    def shop(self, hero):
+        """Return the Store menu choice to make next, or 'q' to stop shopping."""
+        for number, item in enumerate(Store.items, 1):
+            if hero.inventory.count(item.name) < self.stock.get(item.name, 0) and hero.coins >= item.cost:
+                return str(number)
+        return "q"
+
+    def use(self, hero):
+        """Return the name of an item to use next, or None."""
+        if self.use_swords and "Sword" in hero.inventory:
+            return "Sword"
+        if hero.health < self.heal_below and "Tonic" in hero.inventory:
+            return "Tonic"
+        return None
+
+
+def run_campaign(policy, spawner, max_fights=1000):
+    """Play one campaign with a fresh Hero and return its CampaignResult.
+
+    The Hero uses the spawner's random source; the campaign ends when the Hero
+    dies or after max_fights fights.
+    """
+    hero = Hero()
+    hero.rng = spawner.rng
+    bought = Counter()
+    used = Counter()
+    fights = wins = turns = earned = spent = 0
+    killer = None
+    while hero.alive() and fights < max_fights:
+        choice = policy.shop(hero)
+        while choice != "q":
+            coins = hero.coins
+            Store.purchase(hero, choice)
+            if hero.coins == coins:
+                break  # The purchase did not go through; stop rather than ask again
+            bought[Store.items[int(choice) - 1].name] += 1
+            spent += coins - hero.coins
+            choice = policy.shop(hero)
+        item_name = policy.use(hero)
+        while item_name is not None:
+            held = len(hero.inventory)
+            hero.use_item(item_name)
+            if len(hero.inventory) == held:
+                break
+            used[item_name] += 1
+            item_name = policy.use(hero)
+
+        enemy = spawner.spawn()
+        result = run_fight(hero, enemy, policy.battle)
+        spawner.release(enemy)
+        fights += 1
+        turns += result.turns
+        earned += result.coins_earned
+        if result.winner == "hero":
+            wins += 1
+        elif result.winner == "enemy":
+            killer = result.enemy
+    return CampaignResult(fights, wins, turns, earned, spent, hero.coins, bought, used, killer)
+
+
+# Per-campaign numbers summarized by a QuantileSketch each
+METRICS = ("fights", "wins", "turns", "coins_earned", "coins_spent", "final_coins")
+
+
+class CampaignStats:
+    """Bounded-memory aggregates over any number of campaigns; update() merges another CampaignStats."""
+
+    def __init__(self, accuracy=0.01):
+        self.campaigns = 0
+        self.sketches = {metric: QuantileSketch(accuracy) for metric in METRICS}
+        self.survival = Histogram()  # Fights survived per campaign
+        self.counts = Counter()  # "bought:<item>", "used:<item>", "killed_by:<enemy>", "survived"
+
+    def record(self, result):
+        """Add one CampaignResult."""
+        self.campaigns += 1
+        for metric in METRICS:
+            self.sketches[metric].add(getattr(result, metric))
+        self.survival.add(result.fights)
+        counts = self.counts
+        for name, count in result.bought.items():
+            counts[f"bought:{name}"] += count
+        for name, count in result.used.items():
+            counts[f"used:{name}"] += count
+        counts["survived" if result.killer is None else f"killed_by:{result.killer}"] += 1
+
+    def update(self, other):
+        self.campaigns += other.campaigns
+        for metric in METRICS:
+            self.sketches[metric].update(other.sketches[metric])
+        self.survival.update(other.survival)
+        self.counts.update(other.counts)
+
+    def report(self):
+        """Return a text summary."""
+        lines = [f"{self.campaigns:,} campaigns",
+                 f"{'metric':<14} {'mean':>9} {'p10':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"]
+        for metric, sketch in self.sketches.items():
+            quantiles = " ".join(f"{sketch.quantile(q):>8.1f}" for q in (0.1, 0.5, 0.9, 0.99))
+            lines.append(f"{metric:<14} {sketch.mean():>9.2f} {quantiles} {sketch.max:>8}")
+        lines.append("Fights survived: " + " ".join(f"{start}:{count}" for start, count in self.survival.items()[:25]))
+        per_campaign = ", ".join(f"{key} {count / self.campaigns:.3f}" for key, count in sorted(self.counts.items()))
+        lines.append(f"Per campaign: {per_campaign}")
+        return "\n".join(lines)
+
+
+def campaigns(count, rng, policy=None, max_fights=1000, accuracy=0.01):
+    """Play count campaigns and return their CampaignStats; usable as a parallel.run_parallel task."""
+    policy = ShoppingPolicy() if policy is None else policy
+    spawner = EnemyFactory(rng=rng)
+    stats = CampaignStats(accuracy)
+    for _ in range(count):
+        stats.record(run_campaign(policy, spawner, max_fights))
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from functools import partial
+
+    from parallel import run_parallel
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for label, policy in (("Never shop", ShoppingPolicy(stock={})),
+                          ("Tonics and a Sword", ShoppingPolicy()),
+                          ("Sword hoarder", ShoppingPolicy(stock={"Sword": 1}, use_swords=True))):
+        start = time.perf_counter()
+        stats = run_parallel(partial(campaigns, policy=policy), total, seed=7)
+        print(f"\n{label} ({time.perf_counter() - start:.1f}s)\n{stats.report()}")
@@ -0,0 +1,142 @@
+"""Array-backed storage for large numbers of python_rpg characters.
+
+CharacterPool keeps every character's stats column-wise in compact typed
+arrays instead of one Python object per entity, which takes a few dozen bytes
+per character and keeps bulk stat updates to contiguous memory. Code that wants
+objects can use a CharacterView over a row, or materialize a real Character.
+"""
+from array import array
+
+from python_rpg import Hero, Goblin, Shadow, Zombie, Wizard, Archer
+
+# Character classes a pool can hold; a row's kind is an index into this tuple
+KINDS = (Hero, Goblin, Shadow, Zombie, Wizard, Archer)
+KIND_INDEX = {cls: i for i, cls in enumerate(KINDS)}
+
+# Stat columns and their array typecodes; extras default to 0 for kinds without them
+FIELDS = {
+    "health": "i",
+    "power": "i",
+    "coins": "i",
+    "bounty": "i",
+    "resurrections": "h",
+    "mana": "h",
+    "arrows": "h",
+}
+EXTRA_FIELDS = ("resurrections", "mana", "arrows")
+
+
+def _column_property(field):
+    """Build a property that reads and writes one column of the view's row."""
+    def getter(view):
+        return view.pool.columns[field][view.index]
+
+    def setter(view, value):
+        view.pool.columns[field][view.index] = value
+
+    return property(getter, setter, doc=f"The character's {field}, stored in the pool.")
+
+
+class CharacterView:
+    """Object-style access to one row of a CharacterPool."""
+    __slots__ = ("pool", "index")
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def kind(self):
+        """The character class of this row."""
+        return KINDS[self.pool.kinds[self.index]]
+
+    @property
+    def name(self):
+        """The character's name: a custom name if one was stored, otherwise the class name."""
+        return self.pool.names.get(self.index, self.kind.__name__)
+
+    def alive(self):
+        """Check if the character is alive, counting a zombie's remaining resurrections."""
+        return self.pool.is_alive(self.index)
+
+    def __repr__(self):
+        return f"<CharacterView {self.name} #{self.index} health={self.health}>"
+
+
+for _field in FIELDS:
+    setattr(CharacterView, _field, _column_property(_field))
+
+
+class CharacterPool:
+    def __init__(self):
+        """Create an empty pool with one typed array per stat."""
+        self.kinds = array("B")  # Index into KINDS for each row
+        self.columns = {field: array(code) for field, code in FIELDS.items()}
+        self.names = {}  # Custom names only, keyed by row; most rows use their class name
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, character):
+        """Copy a Character's stats into a new row and return the row index."""
+        index = len(self.kinds)
+        self.kinds.append(KIND_INDEX[type(character)])
+        for field, column in self.columns.items():
+            column.append(getattr(character, field, 0))
+        if character.name != type(character).__name__:
+            self.names[index] = character.name
+        return index
+
+    def spawn(self, cls, count):
+        """Add count fresh characters of a class in bulk and return the range of new rows."""
+        template = cls()
+        start = len(self.kinds)
+        self.kinds.extend(array("B", [KIND_INDEX[cls]]) * count)
+        for field, column in self.columns.items():
+            column.extend(array(column.typecode, [getattr(template, field, 0)]) * count)
+        return range(start, start + count)
+
+    def view(self, index):
+        """Return a CharacterView of a row."""
+        return CharacterView(self, index)
+
+    def is_alive(self, index):
+        """Check if the character in a row is alive."""
+        if self.columns["health"][index] > 0:
+            return True
+        return KINDS[self.kinds[index]] is Zombie and self.columns["resurrections"][index] > 0
+
+    def materialize(self, index):
+        """Build a real Character object holding a row's current stats."""
+        cls = KINDS[self.kinds[index]]
+        character = cls()
+        if index in self.names:
+            character.name = self.names[index]
+        for field, column in self.columns.items():
+            if field not in EXTRA_FIELDS or hasattr(character, field):
+                setattr(character, field, column[index])
+        return character
+
+    def store(self, index, character):
+        """Write a Character object's stats back into a row, e.g. after a fight."""
+        for field, column in self.columns.items():
+            column[index] = getattr(character, field, 0)
+
+    def add_to(self, field, amount, rows=None):
+        """Add amount to a stat for every row, or only for the given rows."""
+        column = self.columns[field]
+        for index in (range(len(column)) if rows is None else rows):
+            column[index] += amount
+
+    def as_numpy(self, field):
+        """Return a writable NumPy array sharing memory with a stat column (requires NumPy).
+
+        The pool cannot grow while the returned array is alive.
+        """
+        import numpy as np
+
+        return np.frombuffer(self.columns[field], dtype=self.columns[field].typecode)
+
+    def nbytes(self):
+        """Return the bytes used by the stat arrays."""
+        return sum(len(column) * column.itemsize for column in self.columns.values()) + len(self.kinds)
@@ -0,0 +1,229 @@
+"""Typed game events, an event bus and a compact binary replay log.
+
+Both games report what happens through observers: python_rpg characters
+call their observer, and blackjack_engine.RoundEngine calls its own.
+BusObserver turns those calls into GameEvent records and publishes them on an
+EventBus. ReplayWriter is a bus subscriber that appends events to a binary
+log in batches. read_events() iterates a log lazily, memory-mapping it if
+asked.
+
+Log format (little-endian): a 7-byte header b"RPGLOG" + version, then
+records, each starting with a one-byte tag:
+
+    0  segment start; string ids defined after it start again from 0
+    1  string definition: id (u16), length (u16), UTF-8 bytes
+    2  event: kind (u8), actor id (u16), target id (u16, 0xFFFF for none), value (i64)
+
+Every writer opens a new segment, so logs from several runs can be appended
+to one file.
+"""
+import mmap
+import struct
+from collections import namedtuple
+
+# Every event kind, in code order; codes are stored in the log, so only ever append to this tuple
+KINDS = (
+    "session",
+    # python_rpg
+    "attack", "critical", "kill", "evade", "resurrect", "perish", "spell", "critical_shot", "shot",
+    "out_of_arrows", "buy", "cannot_afford", "missing_item", "heal", "power_up", "idle", "flee", "turn_end",
+    # Blackjack
+    "deal", "hit", "stand", "dealer_draw", "bust", "payout",
+)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+# One game event: who did what to whom, with a single number attached (damage, bounty, cost, hand value, payout...)
+GameEvent = namedtuple("GameEvent", "kind actor target value")
+
+MAGIC = b"RPGLOG"
+VERSION = 2  # Version 1 stored values as i32
+SEGMENT, STRING, EVENT = 0, 1, 2
+NO_TARGET = 0xFFFF
+_STRING = struct.Struct("<BHH")
+_EVENT = struct.Struct("<BBHHq")
+
+
+class EventBus:
+    """Delivers published events to the handlers subscribed to their kind."""
+
+    def __init__(self):
+        self.handlers = {kind: [] for kind in KINDS}
+
+    def subscribe(self, handler, kinds=KINDS):
+        """Call handler(event) for every published event of the given kinds (all kinds by default)."""
+        for kind in kinds:
+            self.handlers[kind].append(handler)
+
+    def unsubscribe(self, handler):
+        """Stop delivering events to a handler."""
+        for handlers in self.handlers.values():
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event):
+        """Deliver an event to its subscribers."""
+        for handler in self.handlers[event.kind]:
+            handler(event)
+
+
+def _name(thing):
+    """Return the name of a character or item, or the text of anything else."""
+    return getattr(thing, "name", None) or str(thing)
+
+
+class BusObserver:
+    """Observer for python_rpg characters and RoundEngine that publishes GameEvents on a bus."""
+    __slots__ = ("bus",)
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    def __call__(self, event, source, *args):
+        target = None
+        value = 0
+        if event in ("attack", "critical", "spell", "critical_shot", "shot"):
+            target, value = args[0].name, args[1]
+        elif event == "kill":
+            target, value = args[0].name, args[0].bounty
+        elif event in ("buy", "cannot_afford"):
+            target, value = args[0].name, args[0].cost
+        elif event in ("heal", "power_up"):
+            value = args[0]
+        elif event in ("missing_item", "turn_end"):
+            target = _name(args[0])
+        elif event in ("deal", "hit", "dealer_draw"):
+            target, value = str(args[0]), source.calculate_hand_value()
+        elif event in ("bust", "payout"):
+            target, value = args[0].outcome, args[0].payout
+        self.bus.publish(GameEvent(event, source.name, target, value))
+
+
+class ReplayWriter:
+    """Appends events to a binary replay log, writing to disk in batches."""
+
+    def __init__(self, path, batch_bytes=1 << 16):
+        self.file = open(path, "ab")
+        self.batch_bytes = batch_bytes
+        self.buffer = bytearray()
+        self.strings = {}  # Name -> id within the current segment
+        if self.file.tell() == 0:
+            self.buffer += MAGIC + bytes([VERSION])
+        else:
+            with open(path, "rb") as existing:
+                header = existing.read(len(MAGIC) + 1)
+            if header != MAGIC + bytes([VERSION]):
+                self.file.close()
+                raise ValueError(f"{path} is not a version {VERSION} replay log; cannot append to it")
+        self.buffer.append(SEGMENT)
+
+    def _string_id(self, text):
+        """Return the id of a string, defining it in the log the first time it is seen."""
+        string_id = self.strings.get(text)
+        if string_id is None:
+            string_id = self.strings[text] = len(self.strings)
+            data = text.encode()
+            self.buffer += _STRING.pack(STRING, string_id, len(data)) + data
+        return string_id
+
+    def write(self, event):
+        """Add an event to the log; usable directly as an EventBus handler."""
+        if len(self.strings) >= NO_TARGET - 2:  # No room for two new ids: start a new segment with an empty table
+            self.strings.clear()
+            self.buffer.append(SEGMENT)
+        target = NO_TARGET if event.target is None else self._string_id(event.target)
+        self.buffer += _EVENT.pack(EVENT, KIND_CODES[event.kind], self._string_id(event.actor), target, event.value)
+        if len(self.buffer) >= self.batch_bytes:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered records to disk."""
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        """Flush and close the log."""
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _parse(data, offset):
+    """Yield the events in a buffer of log records, starting at offset."""
+    strings = []
+    end = len(data)
+    while offset < end:
+        tag = data[offset]
+        if tag == EVENT:
+            _, kind, actor, target, value = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            yield GameEvent(KINDS[kind], strings[actor], None if target == NO_TARGET else strings[target], value)
+        elif tag == STRING:
+            _, string_id, length = _STRING.unpack_from(data, offset)
+            offset += _STRING.size
+            strings.append(bytes(data[offset:offset + length]).decode())
+            offset += length
+        elif tag == SEGMENT:
+            strings = []
+            offset += 1
+        else:
+            raise ValueError(f"Corrupt replay log: unknown record tag {tag} at byte {offset}")
+
+
+def read_events(path, use_mmap=True):
+    """Yield the GameEvents in a replay log one by one.
+
+    With use_mmap the file is memory-mapped rather than read into memory, so
+    very large logs cost only the pages actually touched.
+    """
+    with open(path, "rb") as file:
+        header = file.read(len(MAGIC) + 1)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a replay log")
+        if header[len(MAGIC)] != VERSION:
+            raise ValueError(f"Unsupported replay log version {header[len(MAGIC)]}")
+        if not use_mmap:
+            yield from _parse(file.read(), 0)
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from _parse(data, len(header))
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from collections import Counter
+
+    from python_rpg import Hero, EnemyFactory, AlwaysAttack, run_fight
+    from blackjack_engine import RoundEngine, ThresholdStrategy
+
+    bus = EventBus()
+    observer = BusObserver(bus)
+    path = os.path.join(tempfile.mkdtemp(), "replay.log")
+    with ReplayWriter(path) as writer:
+        bus.subscribe(writer.write)
+        start = time.perf_counter()
+        spawner = EnemyFactory(observer=observer)
+        for session in range(20_000):
+            bus.publish(GameEvent("session", "rpg", None, session))
+            hero = Hero()
+            hero.observer = observer
+            enemy = spawner.spawn()
+            run_fight(hero, enemy, AlwaysAttack())
+            spawner.release(enemy)
+        engine = RoundEngine()
+        engine.observer = observer
+        for _ in range(20_000):
+            engine.player.gold = 1000
+            engine.play_round(ThresholdStrategy())
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    counts = Counter(event.kind for event in read_events(path))
+    print(f"Wrote {sum(counts.values()):,} events ({os.path.getsize(path):,} bytes) in {elapsed:.2f}s, "
+          f"read back in {time.perf_counter() - start:.2f}s")
+    print(dict(counts))
@@ -0,0 +1,180 @@
+"""Opt-in call counters, timers, turn histograms and sampling for both games.
+
+Instrumentation.enable() wraps the hot methods of python_rpg, Blackjack and
+blackjack_engine in counting, timing wrappers, and disable() puts the original
+functions back. Nothing is wrapped until then, so the games run at full speed
+when instrumentation is off. run_fight is wrapped too, so every fight adds its
+turn count to a histogram for its enemy type. This covers modules that
+imported run_fight by name as well.
+
+sample() starts a statistical profiler on a CPU-time interval timer. It counts
+the function running at each tick, or passes the frame to a callback. It uses
+signal.setitimer, so it works on Unix in the main thread only.
+
+    with Instrumentation() as stats:
+        run_parallel(rpg_fights, 10_000, workers=1)
+    print(stats.report())
+"""
+import signal
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import wraps
+
+import python_rpg
+import Blackjack
+import blackjack_engine
+
+# (owner, attribute) of every method wrapped by default; subclass overrides are listed so each is counted separately
+TARGETS = (
+    (python_rpg.Character, "attack"),
+    (python_rpg.Character, "receive_damage"),
+    (python_rpg.Hero, "attack"),
+    (python_rpg.Shadow, "receive_damage"),
+    (python_rpg.Zombie, "receive_damage"),
+    (python_rpg.Wizard, "attack"),
+    (python_rpg.Archer, "attack"),
+    (Blackjack.Character, "draw"),
+    (Blackjack.Character, "calculate_hand_value"),
+    (Blackjack.Dealer, "play"),
+    (Blackjack.Shoe, "reshuffle"),
+    (blackjack_engine.RoundEngine, "play_round"),
+)
+
+
+class Instrumentation:
+    def __init__(self, targets=TARGETS):
+        """Prepare to instrument the given (class, method name) pairs; nothing changes until enable()."""
+        self.targets = targets
+        self.calls = Counter()  # "Class.method" -> calls
+        self.seconds = Counter()  # "Class.method" -> cumulative seconds, including nested calls
+        self.turns = defaultdict(Counter)  # Enemy name -> {turns in a fight: fights}
+        self.samples = Counter()  # "file:function" -> sampler ticks
+        self.originals = []  # (owner, name, original) for everything replaced, to restore on disable
+        self.sampling = False
+
+    def _timed(self, label, function):
+        calls, seconds, clock = self.calls, self.seconds, time.perf_counter
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds[label] += clock() - start
+                calls[label] += 1
+        return wrapper
+
+    def _counted_fight(self, run_fight):
+        turns = self.turns
+
+        @wraps(run_fight)
+        def wrapper(*args, **kwargs):
+            result = run_fight(*args, **kwargs)
+            turns[result.enemy][result.turns] += 1
+            return result
+        return wrapper
+
+    def enable(self):
+        """Wrap every target method and run_fight."""
+        if self.originals:
+            return
+        for owner, name in self.targets:
+            original = owner.__dict__[name]
+            self.originals.append((owner, name, original))
+            setattr(owner, name, self._timed(f"{owner.__name__}.{name}", original))
+        # Rebind run_fight wherever it was imported, not just in python_rpg
+        run_fight = python_rpg.run_fight
+        wrapper = self._counted_fight(run_fight)
+        for module in list(sys.modules.values()):
+            if getattr(module, "run_fight", None) is run_fight:
+                self.originals.append((module, "run_fight", run_fight))
+                setattr(module, "run_fight", wrapper)
+
+    def disable(self):
+        """Restore the original functions and stop any sampling; collected stats are kept."""
+        self.stop_sampling()
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals.clear()
+
+    def sample(self, interval=0.001, callback=None):
+        """Sample the running function every interval seconds of CPU time.
+
+        By default each sample is counted in self.samples; a callback is
+        instead called with the interrupted frame.
+        """
+        samples = self.samples
+
+        def tick(signum, frame):
+            if callback is not None:
+                callback(frame)
+            elif frame is not None:
+                code = frame.f_code
+                samples[f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}"] += 1
+
+        signal.signal(signal.SIGPROF, tick)
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        self.sampling = True
+
+    def stop_sampling(self):
+        """Stop the sampling profiler if it is running."""
+        if self.sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+            self.sampling = False
+
+    def reset(self):
+        """Clear every counter, timer, histogram and sample."""
+        self.calls.clear()
+        self.seconds.clear()
+        self.turns.clear()
+        self.samples.clear()
+
+    def stats(self):
+        """Return the collected numbers as plain dicts."""
+        return {
+            "calls": dict(self.calls),
+            "seconds": dict(self.seconds),
+            "turns": {enemy: dict(sorted(counts.items())) for enemy, counts in self.turns.items()},
+            "samples": dict(self.samples),
+        }
+
+    def report(self, top=15):
+        """Return an end-of-run text report."""
+        lines = [f"{'function':<32} {'calls':>12} {'seconds':>10} {'us/call':>9}"]
+        for label, seconds in self.seconds.most_common():
+            calls = self.calls[label]
+            lines.append(f"{label:<32} {calls:>12,} {seconds:>10.3f} {seconds / calls * 1e6:>9.2f}")
+        if self.turns:
+            lines.append("\nTurns per fight:")
+            for enemy, counts in sorted(self.turns.items()):
+                fights = sum(counts.values())
+                mean = sum(turns * n for turns, n in counts.items()) / fights
+                histogram = " ".join(f"{turns}:{n}" for turns, n in sorted(counts.items()))
+                lines.append(f"  {enemy:<8} {fights:>9,} fights, mean {mean:5.2f}  {histogram}")
+        if self.samples:
+            total = sum(self.samples.values())
+            lines.append(f"\nSampled hot spots ({total:,} samples):")
+            for where, n in self.samples.most_common(top):
+                lines.append(f"  {n / total:6.1%}  {where}")
+        return "\n".join(lines)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+
+if __name__ == "__main__":
+    from parallel import blackjack_rounds, rpg_fights
+    from random import Random
+
+    with Instrumentation() as stats:
+        stats.sample()
+        rpg_fights(50_000, Random(1))
+        blackjack_rounds(50_000, Random(2))
+    print(stats.report())
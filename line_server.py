@@ -0,0 +1,38 @@
+"""Listening and serving shared by the asyncio line-protocol servers.
+
+blackjack_server and rpg_server differ only in what they do with a
+connection. LineServer gives them the same TCP or Unix socket setup, connection
+backlog and serve-until-cancelled loop; a subclass supplies
+handle(reader, writer). run() is the command-line entry point of both.
+"""
+import asyncio
+import sys
+
+
+class LineServer:
+    """Base class for a server whose handle(reader, writer) coroutine serves one connection."""
+
+    async def handle(self, reader, writer):
+        raise NotImplementedError
+
+    async def start(self, host="127.0.0.1", port=0, path=None, backlog=1024):
+        """Start listening on a TCP port, or on a Unix socket if path is given, and return the asyncio server."""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path, backlog=backlog)
+        return await asyncio.start_server(self.handle, host, port, backlog=backlog)
+
+    async def serve(self, host="127.0.0.1", port=0, path=None):
+        """Listen like start() and serve connections until cancelled."""
+        server = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+
+def run(server, default_port, description):
+    """Serve on 127.0.0.1 at the port given as the first command-line argument until interrupted."""
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else default_port
+    print(f"Serving {description} on 127.0.0.1:{port}")
+    try:
+        asyncio.run(server.serve(port=port))
+    except KeyboardInterrupt:
+        pass
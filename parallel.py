@@ -0,0 +1,111 @@
+"""Multi-core simulation runner with reproducible per-chunk random streams.
+
+run_parallel() splits a budget of RPG fights or blackjack rounds into
+fixed-size chunks and runs them on a process pool. Each chunk gets its own
+random.Random seeded from (seed, chunk number), so the same seed gives the
+same totals whatever the worker count. Per-chunk totals are integer Counters,
+merged as they stream back from the workers.
+"""
+import os
+import random
+from collections import Counter
+from functools import partial
+from multiprocessing import Pool
+
+from python_rpg import Hero, AlwaysAttack, EnemyFactory, run_fight
+from Blackjack import Player
+from blackjack_engine import RoundEngine, ThresholdStrategy
+
+def chunk_rng(seed, chunk):
+    """Return the independent random stream for one chunk of a seeded run."""
+    return random.Random(f"{seed}:{chunk}")
+
+
+def rpg_fights(count, rng, policy=None, weights=None):
+    """Fight count battles between a fresh Hero and a pooled random enemy and return the totals."""
+    policy = AlwaysAttack() if policy is None else policy
+    spawner = EnemyFactory(weights, rng=rng)
+    totals = Counter()
+    for _ in range(count):
+        hero = Hero()
+        hero.rng = rng
+        enemy = spawner.spawn()
+        result = run_fight(hero, enemy, policy)
+        spawner.release(enemy)
+        totals["fights"] += 1
+        totals[f"fights:{result.enemy}"] += 1
+        if result.winner == "hero":
+            totals["wins"] += 1
+            totals[f"wins:{result.enemy}"] += 1
+        elif result.winner == "enemy":
+            totals["losses"] += 1
+        elif result.fled:
+            totals["fled"] += 1
+        else:
+            totals["draws"] += 1
+        totals["turns"] += result.turns
+        totals["damage_dealt"] += result.damage_dealt
+        totals["damage_taken"] += result.damage_taken
+        totals["coins_earned"] += result.coins_earned
+    return totals
+
+
+def blackjack_rounds(count, rng, strategy=None):
+    """Play count headless blackjack rounds and return the outcome counts and net gold."""
+    strategy = ThresholdStrategy() if strategy is None else strategy
+    engine = RoundEngine(Player("Player", 0), rng=rng)
+    totals = Counter()
+    for _ in range(count):
+        engine.player.gold = strategy.bet(engine.player)  # Bankroll is not the point here; always cover the bet
+        result = engine.play_round(strategy)
+        totals["rounds"] += 1
+        totals[result.outcome] += 1
+        totals["net_gold"] += result.payout - result.bet
+    return totals
+
+
+def _run_chunk(args):
+    """Run one chunk of a simulation in a worker process."""
+    task, seed, chunk, count = args
+    return task(count, chunk_rng(seed, chunk))
+
+
+def _merge(totals, chunk_totals):
+    """Fold one chunk's totals into the running totals, which start as the first chunk's."""
+    if totals is None:
+        return chunk_totals
+    totals.update(chunk_totals)
+    return totals
+
+
+def run_parallel(task, total, seed=0, chunk_size=10_000, workers=None):
+    """Run a simulation task for a total budget across processes and return the merged totals.
+
+    task is called as task(count, rng) and must return a Counter of integers, or
+    any other picklable object whose update() method merges in another one; use
+    functools.partial to pass extra arguments. Chunking depends only on total
+    and chunk_size, so the result depends only on seed, never on workers.
+    """
+    jobs = [(task, seed, chunk, min(chunk_size, total - start))
+            for chunk, start in enumerate(range(0, total, chunk_size))]
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    totals = None
+    if workers == 1:
+        for job in jobs:
+            totals = _merge(totals, _run_chunk(job))
+    else:
+        with Pool(workers) as pool:
+            for chunk_totals in pool.imap_unordered(_run_chunk, jobs):
+                totals = _merge(totals, chunk_totals)
+    return Counter() if totals is None else totals
+
+
+if __name__ == "__main__":
+    import time
+
+    for name, task, budget in (("RPG fights", rpg_fights, 400_000),
+                               ("Blackjack rounds", partial(blackjack_rounds, strategy=ThresholdStrategy(bet=10)), 400_000)):
+        start = time.perf_counter()
+        totals = run_parallel(task, budget, seed=42)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {dict(sorted(totals.items()))} ({budget / elapsed:,.0f}/s)")
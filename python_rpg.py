@@ -1,7 +1,19 @@
 import random  # Import the random module to use random chance in the game
+from bisect import bisect  # Weighted enemy picks
+from collections import namedtuple  # Lightweight records for fight outcomes
+from itertools import accumulate
+
+# Chances and costs behind the random combat mechanics, shared with the simulators and solver
+HERO_CRIT_CHANCE = 0.2  # Hero attacks deal double damage 20% of the time
+SHADOW_HIT_CHANCE = 0.1  # Shadows only take damage 10% of the time
+ARCHER_CRIT_CHANCE = 0.2  # Archer arrows deal triple damage 20% of the time
+SPELL_COST = 10  # Mana a Wizard spends per spell
+SPELL_BONUS = 5  # Extra damage dealt by a Wizard spell
 
 # Base Character class that represents both the hero and enemies
 class Character:
+    __slots__ = ("name", "health", "power", "coins", "bounty", "observer", "rng")  # No per-instance __dict__
+
     def __init__(self, name, health, power, bounty=0):
         """Initialize a character with a name, health, power, and optional bounty."""
         self.name = name  # Name of the character
@@ -9,6 +21,13 @@ class Character:
         self.power = power  # Attack power of the character
         self.coins = 20  # Start each character with 20 coins
         self.bounty = bounty  # Reward given when the character is defeated
+        self.observer = None  # Optional callable that renders or records game events
+        self.rng = random  # Source of randomness; swap in a random.Random for reproducible runs
+
+    def emit(self, event, *args):
+        """Report a game event to the attached observer, if there is one."""
+        if self.observer is not None:
+            self.observer(event, self, *args)
 
     def alive(self):
         """Check if the character is still alive (health > 0)."""
@@ -16,89 +35,150 @@ class Character:
 
     def attack(self, enemy):
         """Attack an enemy and deal damage equal to the character's power."""
-        enemy.receive_damage(self.power)  # Deal damage to the enemy
-        print(f"{self.name} does {self.power} damage to the {enemy.name}.")
+        dealt = enemy.receive_damage(self.power)  # Deal damage to the enemy
+        self.emit("attack", enemy, self.power)
         if not enemy.alive():  # Check if the enemy is dead after the attack
-            print(f"The {enemy.name} is dead.")
             self.coins += enemy.bounty  # Add enemy's bounty to coins if enemy is dead
-            print(f"{self.name} receives {enemy.bounty} coins bounty.")
+            self.emit("kill", enemy)
+        return dealt
 
     def receive_damage(self, damage):
-        """Reduce the character's health by the given damage amount."""
+        """Reduce the character's health by the given damage amount and return the damage taken."""
         self.health -= damage
+        return damage
+
+    def status(self):
+        """Return the character's current health and power as text."""
+        return f"{self.name} has {self.health} health and {self.power} power."
 
     def print_status(self):
-        """Print the character's current health and power."""
-        print(f"{self.name} has {self.health} health and {self.power} power.")
+        """Print the character's current status."""
+        print(self.status())
+
+# Inventory that stacks identical items and finds them by case-insensitive name
+class Inventory:
+    __slots__ = ("stacks", "total")
+
+    def __init__(self):
+        """Start with no items."""
+        self.stacks = {}  # Case-folded item name -> [item, count], in first-added order
+        self.total = 0  # Number of items across all stacks
+
+    def add(self, item, count=1):
+        """Put count copies of an item on its stack."""
+        stack = self.stacks.get(item.name.casefold())
+        if stack is None:
+            self.stacks[item.name.casefold()] = [item, count]
+        else:
+            stack[1] += count
+        self.total += count
+
+    def take(self, item_name):
+        """Remove one item with the given name (any case) and return it, or None if there is none."""
+        key = item_name.casefold()
+        stack = self.stacks.get(key)
+        if stack is None:
+            return None
+        stack[1] -= 1
+        if stack[1] == 0:
+            del self.stacks[key]
+        self.total -= 1
+        return stack[0]
+
+    def count(self, item_name):
+        """Return how many items with the given name (any case) are held."""
+        stack = self.stacks.get(item_name.casefold())
+        return 0 if stack is None else stack[1]
+
+    def __len__(self):
+        return self.total
+
+    def __contains__(self, item_name):
+        return item_name.casefold() in self.stacks
+
+    def __iter__(self):
+        """Yield (item, count) for each stack."""
+        for item, count in self.stacks.values():
+            yield item, count
+
+    def __str__(self):
+        """List each stack once, e.g. "Tonic x3, Sword"."""
+        return ", ".join(item.name if count == 1 else f"{item.name} x{count}" for item, count in self.stacks.values())
 
 # Hero class, a special type of character with additional features
 class Hero(Character):
+    __slots__ = ("inventory",)
+
     def __init__(self, name="Hero"):
         """Initialize the hero with custom health and power values."""
         super().__init__(name, health=20, power=10)  # Hero starts with 20 health and 10 power
-        self.inventory = []  # List to store the hero's items
+        self.inventory = Inventory()  # The hero's items, stacked by name
 
     def attack(self, enemy):
         """Hero's attack has a 20% chance to deal double damage."""
-        if random.random() < 0.2:  # 20% chance for a double damage attack
+        if self.rng.random() < HERO_CRIT_CHANCE:  # 20% chance for a double damage attack
             damage = self.power * 2
-            print(f"{self.name} does {damage} damage (Double Damage!) to the {enemy.name}.")
+            self.emit("critical", enemy, damage)
         else:
             damage = self.power
-            print(f"{self.name} does {damage} damage to the {enemy.name}.")
-        
-        enemy.receive_damage(damage)  # Deal the calculated damage to the enemy
+            self.emit("attack", enemy, damage)
+
+        dealt = enemy.receive_damage(damage)  # Deal the calculated damage to the enemy
         if not enemy.alive():  # Check if the enemy is dead
-            print(f"The {enemy.name} is dead.")
             self.coins += enemy.bounty  # Gain coins from enemy bounty
-            print(f"{self.name} receives {enemy.bounty} coins bounty.")
+            self.emit("kill", enemy)
+        return dealt
 
     def buy(self, item):
         """Buy an item if the hero has enough coins."""
         if self.coins >= item.cost:  # Check if the hero has enough coins
             self.coins -= item.cost  # Deduct the cost from hero's coins
-            print(f"{self.name} bought {item.name} for {item.cost} coins.")
+            self.emit("buy", item)
             item.apply(self)  # Apply the effect of the item to the hero
-            self.inventory.append(item)  # Add the item to the hero's inventory
+            self.inventory.add(item)  # Add the item to the hero's inventory
         else:
-            print(f"{self.name} doesn't have enough coins to buy {item.name}.")
+            self.emit("cannot_afford", item)
 
     def use_item(self, item_name):
         """Use an item from the hero's inventory."""
-        for item in self.inventory:
-            if item.name.lower() == item_name.lower():
-                item.use(self)  # Use the item
-                self.inventory.remove(item)  # Remove the item from inventory after use
-                return
-        print(f"{self.name} doesn't have a {item_name} in their inventory.")
+        item = self.inventory.take(item_name)  # Remove the item from inventory before use
+        if item is None:
+            self.emit("missing_item", item_name)
+        else:
+            item.use(self)  # Use the item
 
-    def print_status(self):
-        """Print the hero's current health, power, coins, and inventory."""
-        super().print_status()
-        print(f"{self.name} has {self.coins} coins.")
-        print(f"Inventory: {', '.join([item.name for item in self.inventory])}")
+    def status(self):
+        """Return the hero's current health, power, coins, and inventory as text."""
+        return (f"{super().status()}\n{self.name} has {self.coins} coins.\n"
+                f"Inventory: {self.inventory}")
 
 # Goblin class, a specific enemy with predefined attributes
 class Goblin(Character):
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the goblin with custom health, power, and bounty."""
         super().__init__("Goblin", health=18, power=5, bounty=5)
 
 # Shadow class, a specific enemy with unique damage mechanics
 class Shadow(Character):
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the shadow with custom health, power, and bounty."""
         super().__init__("Shadow", health=1, power=7, bounty=6)
 
     def receive_damage(self, damage):
         """Shadow has a 90% chance to avoid damage."""
-        if random.random() < 0.1:  # 10% chance to take damage
-            super().receive_damage(damage)  # Only take damage 10% of the time
-        else:
-            print(f"The attack passes through {self.name} without effect!")
+        if self.rng.random() < SHADOW_HIT_CHANCE:  # 10% chance to take damage
+            return super().receive_damage(damage)  # Only take damage 10% of the time
+        self.emit("evade")
+        return 0
 
 # Zombie class, a specific enemy that can resurrect multiple times
 class Zombie(Character):
+    __slots__ = ("resurrections",)
+
     def __init__(self):
         """Initialize the zombie with custom health, power, and bounty."""
         super().__init__("Zombie", health=10, power=3, bounty=4)
@@ -112,14 +192,17 @@ class Zombie(Character):
         """Reduce zombie's health, with a chance to resurrect if health reaches 0."""
         super().receive_damage(damage)
         if self.health <= 0 and self.resurrections > 0:
-            print(f"{self.name} falls, but rises again!")
+            self.emit("resurrect")
             self.health = 10  # Reset health
             self.resurrections -= 1
         elif self.health <= 0 and self.resurrections == 0:
-            print(f"{self.name} has been permanently defeated!")
+            self.emit("perish")
+        return damage
 
 # Wizard class, a specific enemy with mana and special spell attacks
 class Wizard(Character):
+    __slots__ = ("mana",)
+
     def __init__(self):
         """Initialize the wizard with custom health, power, and bounty."""
         super().__init__("Wizard", health=15, power=8, bounty=7)
@@ -127,21 +210,22 @@ class Wizard(Character):
 
     def attack(self, enemy):
         """Wizard attacks using spells if mana is available, otherwise uses regular attack."""
-        if self.mana >= 10:
-            spell_power = self.power + 5  # Spells deal 5 extra damage
-            self.mana -= 10  # Reduce mana by 10 when casting a spell
-            enemy.receive_damage(spell_power)
-            print(f"{self.name} casts a spell for {spell_power} damage to {enemy.name}.")
-        else:
-            super().attack(enemy)  # Fall back to regular attack if out of mana
-
-    def print_status(self):
-        """Print the wizard's current health, power, and mana."""
-        super().print_status()
-        print(f"{self.name} has {self.mana} mana.")
+        if self.mana >= SPELL_COST:
+            spell_power = self.power + SPELL_BONUS  # Spells deal 5 extra damage
+            self.mana -= SPELL_COST  # Reduce mana by 10 when casting a spell
+            dealt = enemy.receive_damage(spell_power)
+            self.emit("spell", enemy, spell_power)
+            return dealt
+        return super().attack(enemy)  # Fall back to regular attack if out of mana
+
+    def status(self):
+        """Return the wizard's current health, power, and mana as text."""
+        return f"{super().status()}\n{self.name} has {self.mana} mana."
 
 # Archer class, a specific enemy that attacks with arrows
 class Archer(Character):
+    __slots__ = ("arrows",)
+
     def __init__(self):
         """Initialize the archer with custom health, power, and bounty."""
         super().__init__("Archer", health=18, power=7, bounty=6)
@@ -150,22 +234,20 @@ class Archer(Character):
     def attack(self, enemy):
         """Archer attacks using arrows, with a chance for a critical hit."""
         if self.arrows > 0:  # Check if the archer has arrows left
-            critical_chance = 0.2  # 20% chance for a critical hit
-            if random.random() < critical_chance:
+            if self.rng.random() < ARCHER_CRIT_CHANCE:  # 20% chance for a critical hit
                 damage = self.power * 3  # Critical hits deal 3x damage
-                print(f"{self.name} fires a critical shot for {damage} damage to {enemy.name}!")
+                self.emit("critical_shot", enemy, damage)
             else:
                 damage = self.power
-                print(f"{self.name} shoots an arrow for {damage} damage to {enemy.name}.")
+                self.emit("shot", enemy, damage)
             self.arrows -= 1  # Use up one arrow
-            enemy.receive_damage(damage)  # Deal the calculated damage to the enemy
-        else:
-            print(f"{self.name} is out of arrows and can't attack!")
+            return enemy.receive_damage(damage)  # Deal the calculated damage to the enemy
+        self.emit("out_of_arrows")
+        return 0
 
-    def print_status(self):
-        """Print the archer's current health, power, and remaining arrows."""
-        super().print_status()
-        print(f"{self.name} has {self.arrows} arrows left.")
+    def status(self):
+        """Return the archer's current health, power, and remaining arrows as text."""
+        return f"{super().status()}\n{self.name} has {self.arrows} arrows left."
 
 # Item class representing something that can be bought and used by the hero
 class Item:
@@ -191,7 +273,7 @@ class Tonic(Item):
     def apply(self, character):
         """Increase the character's health by 2 when the tonic is used."""
         character.health += 2
-        print(f"{character.name}'s health increased by 2. Current health: {character.health}")
+        character.emit("heal", 2)
 
 # Sword class, an item that increases a character's attack power
 class Sword(Item):
@@ -202,80 +284,246 @@ class Sword(Item):
     def apply(self, character):
         """Increase the character's power by 2 when the sword is bought."""
         character.power += 2
-        print(f"{character.name}'s power increased by 2. Current power: {character.power}")
+        character.emit("power_up", 2)
 
 # Store class for managing item purchases
 class Store:
     # List of available items in the store
     items = [Tonic(), Sword()]
 
+    # Prompt shown while shopping
+    PROMPT = "\nEnter the number of the item you want to buy (or 'q' to quit shopping): "
+
+    @classmethod
+    def catalog(cls, hero):
+        """Return the store's welcome message and list of available items as text."""
+        lines = [f"\nWelcome to the Store, {hero.name}!", f"You have {hero.coins} coins.", "\nAvailable items:"]
+        for i, item in enumerate(cls.items, 1):  # Loop to list available items
+            lines.append(f"{i}. {item.name} (Cost: {item.cost} coins)")
+        return "\n".join(lines)
+
+    @classmethod
+    def purchase(cls, hero, choice):
+        """Buy the item with the chosen number; return an error message if the choice is invalid."""
+        try:
+            item_index = int(choice) - 1  # Get the index of the selected item
+        except ValueError:
+            return "Invalid input. Please enter a number or 'q'."  # Handle invalid input
+        if 0 <= item_index < len(cls.items):  # Validate the choice
+            hero.buy(cls.items[item_index])  # Buy the selected item
+            return None
+        return "Invalid item number."  # Handle invalid item choice
+
     @classmethod
     def do_shopping(cls, hero):
         """Allow the hero to buy items from the store."""
-        print(f"\nWelcome to the Store, {hero.name}!")
-        print(f"You have {hero.coins} coins.")
-        print("\nAvailable items:")
-        for i, item in enumerate(cls.items, 1):  # Loop to display available items
-            print(f"{i}. {item.name} (Cost: {item.cost} coins)")
-        
+        print(cls.catalog(hero))
         while True:
-            choice = input("\nEnter the number of the item you want to buy (or 'q' to quit shopping): ")
+            choice = input(cls.PROMPT)
             if choice.lower() == 'q':
                 break
-            try:
-                item_index = int(choice) - 1  # Get the index of the selected item
-                if 0 <= item_index < len(cls.items):  # Validate the choice
-                    hero.buy(cls.items[item_index])  # Buy the selected item
-                else:
-                    print("Invalid item number.")  # Handle invalid item choice
-            except ValueError:
-                print("Invalid input. Please enter a number or 'q'.")  # Handle invalid input
+            error = cls.purchase(hero, choice)
+            if error:
+                print(error)
+
+# Console observer that renders game events as text for the interactive game
+class ConsoleObserver:
+    __slots__ = ()
+
+    # Message templates for each event; {0} is the character reporting the event
+    MESSAGES = {
+        "attack": "{0.name} does {2} damage to the {1.name}.",
+        "critical": "{0.name} does {2} damage (Double Damage!) to the {1.name}.",
+        "kill": "The {1.name} is dead.\n{0.name} receives {1.bounty} coins bounty.",
+        "evade": "The attack passes through {0.name} without effect!",
+        "resurrect": "{0.name} falls, but rises again!",
+        "perish": "{0.name} has been permanently defeated!",
+        "spell": "{0.name} casts a spell for {2} damage to {1.name}.",
+        "critical_shot": "{0.name} fires a critical shot for {2} damage to {1.name}!",
+        "shot": "{0.name} shoots an arrow for {2} damage to {1.name}.",
+        "out_of_arrows": "{0.name} is out of arrows and can't attack!",
+        "buy": "{0.name} bought {1.name} for {1.cost} coins.",
+        "cannot_afford": "{0.name} doesn't have enough coins to buy {1.name}.",
+        "missing_item": "{0.name} doesn't have a {1} in their inventory.",
+        "heal": "{0.name}'s health increased by {1}. Current health: {0.health}",
+        "power_up": "{0.name}'s power increased by {1}. Current power: {0.power}",
+        "idle": "{0.name} does nothing.",
+        "flee": "{0.name} flees from the battle!",
+    }
+
+    def render(self, event, source, *args):
+        """Return the text for an event, or both status blocks at the end of a turn."""
+        if event == "turn_end":
+            return f"\n{source.status()}\n{args[0].status()}"
+        return self.MESSAGES[event].format(source, *args)
+
+    def __call__(self, event, source, *args):
+        """Print the text for an event."""
+        print(self.render(event, source, *args))
+
+# Actions a battle policy can choose on the hero's turn
+ATTACK = "attack"
+NOTHING = "nothing"
+FLEE = "flee"
+
+# Menus shown to the player, and the battle action for each battle menu choice
+MAIN_MENU = "\nChoose an action:\n1. Fight an enemy\n2. Go to the store\n3. Use an item\n4. Flee"
+BATTLE_MENU = "\nBattle options:\n1. Attack\n2. Do nothing\n3. Flee"
+BATTLE_CHOICES = {"1": ATTACK, "2": NOTHING, "3": FLEE}
+CONFUSED = "Invalid choice. The enemy attacks while you're confused!"
+
+# Outcome record for a single fight, returned by run_fight
+FightResult = namedtuple("FightResult", "enemy winner fled turns damage_dealt damage_taken coins_earned")
+
+# Battle policy that attacks every turn
+class AlwaysAttack:
+    def choose(self, hero, enemy):
+        """Always choose to attack."""
+        return ATTACK
+
+# Battle policy that never acts, letting the enemy attack every turn
+class DoNothing:
+    def choose(self, hero, enemy):
+        """Always choose to do nothing."""
+        return NOTHING
+
+# Battle policy that attacks until the hero's health drops below a threshold
+class FleeBelow:
+    def __init__(self, threshold):
+        """Initialize the policy with the health below which the hero flees."""
+        self.threshold = threshold
+
+    def choose(self, hero, enemy):
+        """Flee when the hero's health is below the threshold, otherwise attack."""
+        return FLEE if hero.health < self.threshold else ATTACK
+
+# Battle policy that asks the player at the console, used by main()
+class ConsolePolicy:
+    def choose(self, hero, enemy):
+        """Show the battle options and return the player's chosen action."""
+        print(BATTLE_MENU)
+        action = BATTLE_CHOICES.get(input("Enter your choice (1-3): "))
+        if action is None:
+            print(CONFUSED)
+        return action
+
+def play_turn(hero, enemy, action):
+    """Play one battle turn with the hero's chosen action.
+
+    Returns (damage dealt, damage taken), or None if the hero fled.
+    """
+    damage_dealt = damage_taken = 0
+    if action == ATTACK:
+        damage_dealt = hero.attack(enemy)
+    elif action == FLEE:
+        hero.emit("flee")
+        return None
+    elif action == NOTHING:
+        hero.emit("idle")
+
+    if enemy.alive():
+        damage_taken = enemy.attack(hero)
+    hero.emit("turn_end", enemy)
+    return damage_dealt, damage_taken
+
+def run_fight(hero, enemy, policy, max_turns=1000):
+    """Run a fight to completion under a battle policy and return a FightResult.
+
+    Nothing is printed unless an observer is attached to the hero or enemy.
+    A fight that reaches max_turns (use None for no limit) ends with no winner.
+    """
+    starting_coins = hero.coins
+    turns = damage_dealt = damage_taken = 0
+    fled = False
+    while enemy.alive() and hero.alive():  # Continue battle while both are alive
+        if turns == max_turns:
+            break
+        turns += 1
+        damage = play_turn(hero, enemy, policy.choose(hero, enemy))
+        if damage is None:
+            fled = True
+            break
+        damage_dealt += damage[0]
+        damage_taken += damage[1]
+
+    if not enemy.alive():
+        winner = "hero"
+    elif not hero.alive():
+        winner = "enemy"
+    else:
+        winner = None  # The hero fled or the turn limit was reached
+    return FightResult(enemy.name, winner, fled, turns, damage_dealt, damage_taken, hero.coins - starting_coins)
+
+# Enemy classes and how often each one is met by default
+ENEMY_WEIGHTS = {Goblin: 1, Shadow: 1, Zombie: 1, Wizard: 1, Archer: 1}
+
+# Factory that spawns random enemies from a weighted table, recycling released ones
+class EnemyFactory:
+    def __init__(self, weights=None, observer=None, rng=random):
+        """Set up the spawn table (a dict of enemy class to weight) and an empty pool."""
+        weights = ENEMY_WEIGHTS if weights is None else weights
+        self.classes = list(weights)
+        self.cumulative = list(accumulate(weights.values()))  # Running totals for weighted picks
+        self.observer = observer
+        self.rng = rng
+        self.pool = {cls: [] for cls in self.classes}  # Released enemies waiting to be reused
+        self.templates = {}  # Class -> (untouched instance, names of its stat slots), made on first reuse
+        self.created = 0  # Enemies built from scratch
+        self.reused = 0  # Enemies recycled from the pool
+
+    def spawn(self, cls=None):
+        """Return a fresh enemy, of a weighted random class unless one is given."""
+        if cls is None:
+            cls = self.classes[bisect(self.cumulative, self.rng.random() * self.cumulative[-1])]
+        free = self.pool[cls]
+        if free:
+            enemy = free.pop()
+            self.restore(enemy)
+            self.reused += 1
+        else:
+            enemy = cls()
+            self.created += 1
+        enemy.observer = self.observer
+        enemy.rng = self.rng
+        return enemy
+
+    def restore(self, enemy):
+        """Copy a fresh enemy's starting stats onto a released one of the same class."""
+        cls = type(enemy)
+        if cls not in self.templates:
+            fields = [name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())
+                      if name not in ("observer", "rng")]
+            self.templates[cls] = (cls(), fields)
+        template, fields = self.templates[cls]
+        for field in fields:
+            setattr(enemy, field, getattr(template, field))
+
+    def release(self, enemy):
+        """Return an enemy to the pool once its encounter is over."""
+        self.pool[type(enemy)].append(enemy)
 
 # Main game function
 def main():
     """Main game loop."""
     hero = Hero(input("Enter your hero's name: "))  # Create a hero with a custom name
-    enemies = [Goblin(), Shadow(), Zombie(), Wizard(), Archer()]  # List of possible enemies
+    console = ConsoleObserver()  # Render game events as text for the player
+    hero.observer = console
+    spawner = EnemyFactory(observer=console)  # Fresh enemies for every encounter
     
     while hero.alive():  # Continue the game while the hero is alive
         print("\n" + "=" * 40)
         hero.print_status()
-        print("\nChoose an action:")
-        print("1. Fight an enemy")
-        print("2. Go to the store")
-        print("3. Use an item")
-        print("4. Flee")
-        
+        print(MAIN_MENU)
+
         choice = input("Enter your choice (1-4): ")
         
         if choice == "1":
-            enemy = random.choice(enemies)  # Select a random enemy
+            enemy = spawner.spawn()  # Select a random enemy
             print(f"\nYou encounter a {enemy.name}!")
-            while enemy.alive() and hero.alive():  # Continue battle while both are alive
-                print("\nBattle options:")
-                print("1. Attack")
-                print("2. Do nothing")
-                print("3. Flee")
-                battle_choice = input("Enter your choice (1-3): ")
-                
-                if battle_choice == "1":
-                    hero.attack(enemy)
-                elif battle_choice == "2":
-                    print(f"{hero.name} does nothing.")
-                elif battle_choice == "3":
-                    print(f"{hero.name} flees from the battle!")
-                    break
-                else:
-                    print("Invalid choice. The enemy attacks while you're confused!")
-                
-                if enemy.alive():
-                    enemy.attack(hero)
-                print()
-                hero.print_status()
-                enemy.print_status()
-            
+            run_fight(hero, enemy, ConsolePolicy(), max_turns=None)
             if not enemy.alive():
                 print(f"You defeated the {enemy.name}!")
+            spawner.release(enemy)
         elif choice == "2":
             Store.do_shopping(hero)  # Enter the store
         elif choice == "3":
@@ -0,0 +1,160 @@
+"""Asyncio session server for python_rpg adventures.
+
+Many players each run their own Hero adventure over one local socket. The
+menu, battle and store flow from python_rpg.main() runs as coroutines that
+await the player's next line instead of calling input(). A session holds only
+its Hero and a small observer that buffers event text. Enemies come from one
+EnemyFactory pool shared by every session and go back to it after each
+encounter. The Store's items carry no per-player state, so all sessions share
+them.
+"""
+import asyncio
+
+from python_rpg import (Hero, Store, ConsoleObserver, EnemyFactory, MAIN_MENU, BATTLE_MENU, BATTLE_CHOICES, CONFUSED,
+                        play_turn)
+from line_server import LineServer, run
+
+
+class BufferedObserver(ConsoleObserver):
+    """Collects rendered event text for a session instead of printing it."""
+    __slots__ = ("lines",)
+
+    def __init__(self):
+        self.lines = []
+
+    def __call__(self, event, source, *args):
+        self.lines.append(self.render(event, source, *args))
+
+
+class AdventureSession:
+    __slots__ = ("reader", "writer", "idle_timeout", "spawner", "observer", "hero")
+
+    def __init__(self, reader, writer, idle_timeout, spawner):
+        """Set up a session for one connection; the Hero is created once the player gives a name."""
+        self.reader = reader
+        self.writer = writer
+        self.idle_timeout = idle_timeout
+        self.spawner = spawner
+        self.observer = BufferedObserver()
+        self.hero = None
+
+    async def say(self, text):
+        """Send any buffered event text followed by a message, waiting for the socket to drain."""
+        lines = self.observer.lines
+        lines.append(text)
+        self.writer.write(("\n".join(lines) + "\n").encode())
+        lines.clear()
+        await self.writer.drain()
+
+    async def ask(self, prompt):
+        """Send a prompt and return the player's reply, or None if they disconnect or go idle."""
+        await self.say(prompt)
+        try:
+            line = await asyncio.wait_for(self.reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            return None
+        except ValueError:
+            return None  # A line longer than the stream limit; end the session as if the player left
+        return line.decode(errors="replace").strip() if line else None
+
+    async def run(self):
+        """Play the main game loop for this player."""
+        name = await self.ask("Enter your hero's name: ")
+        if name is None:
+            return
+        hero = self.hero = Hero(name or "Hero")
+        hero.observer = self.observer
+
+        while hero.alive():  # Continue the game while the hero is alive
+            choice = await self.ask(f"\n{'=' * 40}\n{hero.status()}\n{MAIN_MENU}\nEnter your choice (1-4): ")
+            if choice is None:
+                return
+            if choice == "1":
+                if not await self.fight():
+                    return
+            elif choice == "2":
+                if not await self.shop():
+                    return
+            elif choice == "3":
+                item_name = await self.ask("Enter the name of the item you want to use: ")
+                if item_name is None:
+                    return
+                hero.use_item(item_name)  # Use an item from inventory
+            elif choice == "4":
+                await self.say(f"{hero.name} flees from the adventure. Game Over!")
+                return
+            else:
+                await self.say("Invalid choice. Please enter a number between 1 and 4.")
+
+        await self.say("Game Over! Your hero has been defeated.")
+
+    async def fight(self):
+        """Battle a new random enemy. Return False if the player disconnected."""
+        hero = self.hero
+        enemy = self.spawner.spawn()  # A fresh enemy for every encounter
+        enemy.observer = self.observer
+        try:
+            await self.say(f"\nYou encounter a {enemy.name}!")
+            while enemy.alive() and hero.alive():  # Continue battle while both are alive
+                choice = await self.ask(f"{BATTLE_MENU}\nEnter your choice (1-3): ")
+                if choice is None:
+                    return False
+                action = BATTLE_CHOICES.get(choice)
+                if action is None:
+                    self.observer.lines.append(CONFUSED)
+                if play_turn(hero, enemy, action) is None:
+                    break  # The hero fled
+            if not enemy.alive():
+                await self.say(f"You defeated the {enemy.name}!")
+            return True
+        finally:
+            enemy.observer = None
+            self.spawner.release(enemy)
+
+    async def shop(self):
+        """Visit the shared Store. Return False if the player disconnected."""
+        await self.say(Store.catalog(self.hero))
+        while True:
+            choice = await self.ask(Store.PROMPT)
+            if choice is None:
+                return False
+            if choice.lower() == 'q':
+                return True
+            error = Store.purchase(self.hero, choice)
+            if error:
+                self.observer.lines.append(error)
+
+
+class AdventureServer(LineServer):
+    def __init__(self, max_sessions=10000, idle_timeout=1800.0):
+        """Configure the session limit and how long an idle player may keep a session."""
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions = 0  # Sessions currently open
+        self.spawner = EnemyFactory()  # Enemy pool shared by all sessions
+
+    async def handle(self, reader, writer):
+        """Run one player's adventure, refusing the connection if the server is full."""
+        try:
+            if self.sessions >= self.max_sessions:
+                writer.write(b"Server full, try again later.\n")
+                await writer.drain()
+                return
+            self.sessions += 1
+            try:
+                await AdventureSession(reader, writer, self.idle_timeout, self.spawner).run()
+            finally:
+                self.sessions -= 1
+        except ConnectionError:
+            pass  # The player went away; the session simply ends
+        finally:
+            writer.close()
+
+
+async def serve(host="127.0.0.1", port=8020, path=None, **options):
+    """Run an AdventureServer until cancelled."""
+    await AdventureServer(**options).serve(host, port, path)
+
+
+if __name__ == "__main__":
+    run(AdventureServer(), 8020, "python_rpg adventures")
@@ -0,0 +1,135 @@
+"""Exact win-probability solver for python_rpg fights.
+
+Every mechanic in python_rpg.py is a small discrete random process, so a fight
+is a Markov chain over (hero health, enemy health, resurrections, mana,
+arrows). FightSolver walks that chain by memoized dynamic programming and
+returns exact outcome probabilities, expected turns and expected coins. The
+numbers are a reference for run_fight() and rpg_vectorized.
+"""
+from collections import namedtuple
+
+from python_rpg import (Hero, Goblin, Shadow, Zombie, Wizard, Archer, AlwaysAttack, DoNothing, FleeBelow,
+                        HERO_CRIT_CHANCE, SHADOW_HIT_CHANCE, ARCHER_CRIT_CHANCE, SPELL_COST, SPELL_BONUS)
+
+# Enemy classes the solver knows, by name
+ENEMY_TYPES = {cls.__name__: cls for cls in (Goblin, Shadow, Zombie, Wizard, Archer)}
+
+# Exact outcome of a fight under a fixed policy
+FightOdds = namedtuple("FightOdds", "enemy win loss fled draw expected_turns expected_coins")
+
+# Per-state values: probabilities of each ending, then the expected number of remaining turns
+_WIN = (1.0, 0.0, 0.0, 0.0, 0.0)
+_LOSS = (0.0, 1.0, 0.0, 0.0, 0.0)
+_FLED = (0.0, 0.0, 1.0, 0.0, 1.0)  # Fleeing still takes a turn
+_DRAW = (0.0, 0.0, 0.0, 1.0, 0.0)
+
+
+class FightSolver:
+    def __init__(self, enemy, policy=None, hero_health=None, hero_power=None, hero_crit=HERO_CRIT_CHANCE):
+        """Set up a solver for a Hero fighting enemies like the given template.
+
+        The policy is one of python_rpg's AlwaysAttack, DoNothing or FleeBelow.
+        Hero stats default to a fresh Hero's.
+        """
+        hero = Hero()
+        self.enemy = enemy
+        self.kind = type(enemy).__name__
+        self.hero_health = hero.health if hero_health is None else hero_health
+        self.hero_power = hero.power if hero_power is None else hero_power
+        self.hero_crit = hero_crit  # Chance of a double-damage attack
+        policy = AlwaysAttack() if policy is None else policy
+        if isinstance(policy, FleeBelow):
+            self.flee_below, self.idle = policy.threshold, False
+        elif isinstance(policy, DoNothing):
+            self.flee_below, self.idle = 0, True
+        elif isinstance(policy, AlwaysAttack):
+            self.flee_below, self.idle = 0, False
+        else:
+            raise TypeError(f"Cannot solve fights under a {type(policy).__name__} policy")
+        self.memo = {}  # Values of solved states, keyed by the full fight state
+
+    def _hero_turn(self, enemy_hp, lives):
+        """Return the (probability, enemy health, resurrections) outcomes of a hero attack."""
+        outcomes = []
+        for chance, damage in ((self.hero_crit, self.hero_power * 2), (1 - self.hero_crit, self.hero_power)):
+            if self.kind == "Shadow":
+                outcomes.append((chance * SHADOW_HIT_CHANCE, enemy_hp - damage, lives))
+                outcomes.append((chance * (1 - SHADOW_HIT_CHANCE), enemy_hp, lives))
+            elif enemy_hp - damage <= 0 and lives > 0:
+                outcomes.append((chance, self.enemy.health, lives - 1))  # The zombie rises again
+            else:
+                outcomes.append((chance, enemy_hp - damage, lives))
+        return outcomes
+
+    def _enemy_turn(self, mana, arrows):
+        """Return the (probability, damage, mana, arrows) outcomes of an enemy attack."""
+        power = self.enemy.power
+        if self.kind == "Wizard" and mana >= SPELL_COST:
+            return [(1.0, power + SPELL_BONUS, mana - SPELL_COST, arrows)]
+        if self.kind == "Archer":
+            if arrows <= 0:
+                return [(1.0, 0, mana, arrows)]
+            return [(ARCHER_CRIT_CHANCE, power * 3, mana, arrows - 1),
+                    (1 - ARCHER_CRIT_CHANCE, power, mana, arrows - 1)]
+        return [(1.0, power, mana, arrows)]
+
+    def value(self, state):
+        """Return (win, loss, fled, draw, expected turns) from a state where both sides are alive."""
+        if state in self.memo:
+            return self.memo[state]
+        hero_hp, enemy_hp, lives, mana, arrows = state
+        if hero_hp < self.flee_below:
+            self.memo[state] = _FLED
+            return _FLED
+
+        stay = 0.0  # Probability that a turn leaves the state unchanged
+        total = [0.0, 0.0, 0.0, 0.0, 1.0]
+        hero_turn = [(1.0, enemy_hp, lives)] if self.idle else self._hero_turn(enemy_hp, lives)
+        for chance, next_enemy_hp, next_lives in hero_turn:
+            if next_enemy_hp <= 0 and next_lives == 0:
+                outcomes = [(chance, _WIN)]
+            else:
+                outcomes = []
+                for odds, damage, next_mana, next_arrows in self._enemy_turn(mana, arrows):
+                    next_hero_hp = hero_hp - damage
+                    next_state = (next_hero_hp, next_enemy_hp, next_lives, next_mana, next_arrows)
+                    if next_hero_hp <= 0:
+                        outcomes.append((chance * odds, _LOSS))
+                    elif next_state == state:
+                        stay += chance * odds
+                    else:
+                        outcomes.append((chance * odds, self.value(next_state)))
+            for p, values in outcomes:
+                for i in range(5):
+                    total[i] += p * values[i]
+
+        if stay >= 1.0:
+            result = _DRAW  # Neither side can ever change the fight again
+        else:
+            result = tuple(v / (1.0 - stay) for v in total)
+        self.memo[state] = result
+        return result
+
+    def solve(self):
+        """Return the FightOdds for a fight from the starting state.
+
+        A fight that can never change again (an idle hero facing an Archer with
+        no arrows) counts as a draw, and its turns are counted up to that point.
+        """
+        enemy = self.enemy
+        state = (self.hero_health, enemy.health, getattr(enemy, "resurrections", 0),
+                 getattr(enemy, "mana", 0), getattr(enemy, "arrows", 0))
+        win, loss, fled, draw, turns = self.value(state)
+        return FightOdds(self.kind, win, loss, fled, draw, turns, win * enemy.bounty)
+
+
+def solve(enemy_name, policy=None, hero_health=None, hero_power=None):
+    """Return the exact FightOdds of a fresh Hero against the named enemy type."""
+    return FightSolver(ENEMY_TYPES[enemy_name](), policy, hero_health, hero_power).solve()
+
+
+if __name__ == "__main__":
+    for enemy_name in ENEMY_TYPES:
+        odds = solve(enemy_name)
+        print(f"{enemy_name:7} win {odds.win:.6f}, loss {odds.loss:.6f}, "
+              f"expected turns {odds.expected_turns:.4f}, expected coins {odds.expected_coins:.4f}")
@@ -0,0 +1,147 @@
+"""Vectorized Monte Carlo fight simulator for python_rpg.
+
+Steps many independent Hero-vs-enemy fights in lockstep as NumPy arrays. Every
+random mechanic of the classes in python_rpg.py (hero double damage, Shadow
+evasion, Zombie resurrections, Wizard spells and Archer arrows) becomes a masked
+array update, so millions of fights run in seconds. Results match run_fight()
+statistically, not draw for draw.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from python_rpg import (Hero, Goblin, Shadow, Zombie, Wizard, Archer, HERO_CRIT_CHANCE, SHADOW_HIT_CHANCE,
+                        ARCHER_CRIT_CHANCE, SPELL_COST, SPELL_BONUS)
+
+# Enemy classes the simulator knows how to vectorize, by name
+ENEMY_TYPES = {cls.__name__: cls for cls in (Goblin, Shadow, Zombie, Wizard, Archer)}
+
+# Aggregated outcome of a batch of simulated fights
+SimulationResult = namedtuple("SimulationResult", "enemy fights wins losses fled draws coins_earned turn_histogram")
+
+
+def _merge(result, other):
+    """Combine two SimulationResults for the same enemy into one."""
+    size = max(len(result.turn_histogram), len(other.turn_histogram))
+    histogram = np.zeros(size, dtype=np.int64)
+    histogram[:len(result.turn_histogram)] += result.turn_histogram
+    histogram[:len(other.turn_histogram)] += other.turn_histogram
+    return SimulationResult(
+        result.enemy,
+        result.fights + other.fights,
+        result.wins + other.wins,
+        result.losses + other.losses,
+        result.fled + other.fled,
+        result.draws + other.draws,
+        result.coins_earned + other.coins_earned,
+        histogram,
+    )
+
+
+def _simulate_batch(enemy, n, rng, hero_health, hero_power, flee_below, idle, max_turns):
+    """Simulate n fights against copies of the enemy template and return a SimulationResult."""
+    name = type(enemy).__name__
+    hero_hp = np.full(n, hero_health, dtype=np.int32)
+    enemy_hp = np.full(n, enemy.health, dtype=np.int32)
+    lives = np.full(n, getattr(enemy, "resurrections", 0), dtype=np.int8)
+    mana = np.full(n, getattr(enemy, "mana", 0), dtype=np.int32)
+    arrows = np.full(n, getattr(enemy, "arrows", 0), dtype=np.int32)
+
+    outcome_turns = []  # Number of fights that finished on each turn
+    wins = losses = fled = 0
+    turn = 0
+    while n:
+        turn += 1
+        # Hero's action: attack, do nothing, or flee below the health threshold
+        fleeing = hero_hp < flee_below
+        attacking = ~fleeing if not idle else np.zeros(n, dtype=bool)
+        damage = np.where(rng.random(n) < HERO_CRIT_CHANCE, hero_power * 2, hero_power)
+        if name == "Shadow":
+            attacking &= rng.random(n) < SHADOW_HIT_CHANCE
+        enemy_hp -= np.where(attacking, damage, 0)
+        if name == "Zombie":
+            rising = (enemy_hp <= 0) & (lives > 0)
+            enemy_hp[rising] = enemy.health
+            lives[rising] -= 1
+        enemy_alive = (enemy_hp > 0) | (lives > 0)
+
+        # Enemy's counterattack for fights that are still going
+        striking = enemy_alive & ~fleeing
+        if name == "Wizard":
+            casting = striking & (mana >= SPELL_COST)
+            mana -= np.where(casting, SPELL_COST, 0)
+            hit = np.where(casting, enemy.power + SPELL_BONUS, enemy.power)
+        elif name == "Archer":
+            shooting = striking & (arrows > 0)
+            arrows -= shooting
+            crit = rng.random(n) < ARCHER_CRIT_CHANCE
+            hit = np.where(shooting, np.where(crit, enemy.power * 3, enemy.power), 0)
+        else:
+            hit = enemy.power
+        hero_hp -= np.where(striking, hit, 0)
+
+        # Retire finished fights and keep stepping the rest
+        won = ~enemy_alive
+        lost = enemy_alive & (hero_hp <= 0)
+        done = won | lost | fleeing
+        if turn == max_turns:
+            done[:] = True
+        wins += int(np.count_nonzero(won))
+        losses += int(np.count_nonzero(lost))
+        fled += int(np.count_nonzero(fleeing))
+        finished = int(np.count_nonzero(done))
+        outcome_turns.append(finished)
+        if finished:
+            keep = ~done
+            hero_hp, enemy_hp, lives, mana, arrows = (a[keep] for a in (hero_hp, enemy_hp, lives, mana, arrows))
+            n -= finished
+
+    fights = sum(outcome_turns)
+    histogram = np.zeros(turn + 1, dtype=np.int64)
+    histogram[1:] = outcome_turns
+    return SimulationResult(name, fights, wins, losses, fled, fights - wins - losses - fled, wins * enemy.bounty, histogram)
+
+
+def simulate(enemy_name, n, seed=None, hero_health=None, hero_power=None, flee_below=0, idle=False,
+             max_turns=1000, batch_size=1_000_000):
+    """Simulate n fights between a fresh Hero and the named enemy type.
+
+    The hero attacks every turn unless idle is set (the DoNothing policy) and
+    flees when its health drops below flee_below (the FleeBelow policy). Fights
+    run in batches of batch_size to bound memory use.
+    """
+    enemy = ENEMY_TYPES[enemy_name]()
+    hero = Hero()
+    hero_health = hero.health if hero_health is None else hero_health
+    hero_power = hero.power if hero_power is None else hero_power
+    rng = np.random.default_rng(seed)
+
+    result = None
+    while n > 0:
+        size = min(n, batch_size)
+        batch = _simulate_batch(enemy, size, rng, hero_health, hero_power, flee_below, idle, max_turns)
+        result = batch if result is None else _merge(result, batch)
+        n -= size
+    return result
+
+
+def win_rate(result):
+    """Return the fraction of simulated fights the hero won."""
+    return result.wins / result.fights if result.fights else 0.0
+
+
+def mean_turns(result):
+    """Return the average fight length in turns."""
+    turns = np.arange(len(result.turn_histogram))
+    return float(turns @ result.turn_histogram) / result.fights if result.fights else 0.0
+
+
+if __name__ == "__main__":
+    import time
+
+    for enemy_name in ENEMY_TYPES:
+        start = time.perf_counter()
+        result = simulate(enemy_name, 10_000_000, seed=0)
+        elapsed = time.perf_counter() - start
+        print(f"{enemy_name:7} win rate {win_rate(result):.4f}, mean turns {mean_turns(result):.3f} "
+              f"({result.fights / elapsed:,.0f} fights/s)")
@@ -0,0 +1,324 @@
+"""Compact, versioned binary snapshots of game state.
+
+dumps() packs any mix of python_rpg Heroes, enemies and EnemyFactory pools,
+and Blackjack Shoes, Players and Dealers into bytes; loads() rebuilds them.
+A long-running server can keep an idle session as a few hundred bytes and wake
+it on demand. save_sessions() writes many sessions to one file behind an index
+of offsets; SessionFile maps such a file and restores any one session on demand.
+
+Observers and random sources are not saved; loads() attaches the ones it is
+given. Items are stored by name and restored as the Store's shared instances,
+so dumps() refuses a Hero holding any item the Store does not sell.
+
+Layout (little-endian): b"RPGSNAP" + version byte, then one record per
+object, each a one-byte tag followed by the object's fields. Strings are a u16
+length and UTF-8 bytes. An enemy's name is stored only if it differs from its
+class name, as an empty string otherwise. Card ids use Shoe's numbering
+(suit * 13 + value). A sessions file has the same header, a u32 session count,
+an index of (key, u64 offset, u32 length) entries and then the record blobs.
+"""
+import mmap
+import random
+import struct
+from array import array
+
+from python_rpg import Hero, Goblin, Shadow, Zombie, Wizard, Archer, Store, EnemyFactory
+from Blackjack import SUIT_NAMES, VALUE_NAMES, Shoe, Player, Dealer, card_for
+
+MAGIC = b"RPGSNAP"
+VERSION = 2  # Version 1 did not store enemy names
+HEADER = MAGIC + bytes([VERSION])
+
+HERO, ENEMY, FACTORY, SHOE, PLAYER, DEALER = range(1, 7)
+
+# Enemy classes by stored code, and the extra counter each one keeps; only ever append
+ENEMY_KINDS = (Goblin, Shadow, Zombie, Wizard, Archer)
+ENEMY_CODES = {cls: code for code, cls in enumerate(ENEMY_KINDS)}
+ENEMY_EXTRA = {Zombie: "resurrections", Wizard: "mana", Archer: "arrows"}
+
+# Card id of each (suit, value), matching Blackjack.card_for
+CARD_IDS = {(suit, value): s * 13 + v for s, suit in enumerate(SUIT_NAMES) for v, value in enumerate(VALUE_NAMES)}
+
+_STATS = struct.Struct("<4i")  # health, power, coins, bounty
+_ENEMY = struct.Struct("<B4ii")  # kind, stats, extra counter
+_STACK = struct.Struct("<I")
+_FACTORY = struct.Struct("<BIII")  # classes, created, reused, pooled enemies
+_WEIGHT = struct.Struct("<Bd")
+_SHOE = struct.Struct("<BIII")  # decks, cut, position, cards
+_GOLD = struct.Struct("<q")
+_COUNT = struct.Struct("<I")
+_ENTRY = struct.Struct("<QI")
+_U16 = struct.Struct("<H")
+
+
+def _pack_str(text):
+    data = text.encode()
+    return _U16.pack(len(data)) + data
+
+
+def _unpack_str(data, offset):
+    """Return a string and the offset just past it."""
+    (length,) = _U16.unpack_from(data, offset)
+    offset += _U16.size
+    return bytes(data[offset:offset + length]).decode(), offset + length
+
+
+def _pack_hand(character):
+    return bytes([len(character.hand)]) + bytes(CARD_IDS[card.suit, card.value] for card in character.hand)
+
+
+def _unpack_hand(character, data, offset):
+    """Deal a stored hand back into a Blackjack character and return the offset past it."""
+    count = data[offset]
+    for card_id in data[offset + 1:offset + 1 + count]:
+        character.add_card(card_for(card_id))
+    return offset + 1 + count
+
+
+def _pack_enemy(enemy):
+    cls = type(enemy)
+    extra = ENEMY_EXTRA.get(cls)
+    name = enemy.name if enemy.name != cls.__name__ else ""  # Only custom names are stored
+    return _ENEMY.pack(ENEMY_CODES[cls], enemy.health, enemy.power, enemy.coins, enemy.bounty,
+                       getattr(enemy, extra) if extra else 0) + _pack_str(name)
+
+
+def _unpack_enemy(data, offset, observer, rng):
+    code, health, power, coins, bounty, extra = _ENEMY.unpack_from(data, offset)
+    cls = ENEMY_KINDS[code]
+    enemy = cls()
+    enemy.health, enemy.power, enemy.coins, enemy.bounty = health, power, coins, bounty
+    if cls in ENEMY_EXTRA:
+        setattr(enemy, ENEMY_EXTRA[cls], extra)
+    name, offset = _unpack_str(data, offset + _ENEMY.size)
+    if name:
+        enemy.name = name
+    enemy.observer, enemy.rng = observer, rng
+    return enemy, offset
+
+
+def _pack(obj):
+    """Return the tagged record for one object."""
+    if isinstance(obj, Hero):
+        parts = [bytes([HERO]), _pack_str(obj.name), _STATS.pack(obj.health, obj.power, obj.coins, obj.bounty),
+                 _U16.pack(len(obj.inventory.stacks))]
+        stocked = {item.name: type(item) for item in Store.items}
+        for item, count in obj.inventory:
+            if stocked.get(item.name) is not type(item):
+                raise TypeError(f"Cannot snapshot a {item.name!r} {type(item).__name__}: only Store items can be restored")
+            parts += (_pack_str(item.name), _STACK.pack(count))
+        return b"".join(parts)
+    if type(obj) in ENEMY_CODES:
+        return bytes([ENEMY]) + _pack_enemy(obj)
+    if isinstance(obj, EnemyFactory):
+        weights = [obj.cumulative[0]] + [b - a for a, b in zip(obj.cumulative, obj.cumulative[1:])]
+        pooled = [enemy for free in obj.pool.values() for enemy in free]
+        parts = [bytes([FACTORY]), _FACTORY.pack(len(obj.classes), obj.created, obj.reused, len(pooled))]
+        parts += (_WEIGHT.pack(ENEMY_CODES[cls], weight) for cls, weight in zip(obj.classes, weights))
+        parts += (_pack_enemy(enemy) for enemy in pooled)
+        return b"".join(parts)
+    if isinstance(obj, Shoe):
+        return bytes([SHOE]) + _SHOE.pack(obj.decks, obj.cut, obj.position, len(obj.card_ids)) + obj.card_ids.tobytes()
+    if isinstance(obj, Player):
+        return bytes([PLAYER]) + _pack_str(obj.name) + _GOLD.pack(obj.gold) + _pack_hand(obj)
+    if isinstance(obj, Dealer):
+        return bytes([DEALER]) + _pack_hand(obj)
+    raise TypeError(f"Cannot snapshot {type(obj).__name__} objects")
+
+
+def _unpack(data, offset, observer, rng):
+    """Rebuild the object whose record starts at offset; return it and the offset past it."""
+    tag = data[offset]
+    offset += 1
+    if tag == HERO:
+        name, offset = _unpack_str(data, offset)
+        hero = Hero(name)
+        hero.health, hero.power, hero.coins, hero.bounty = _STATS.unpack_from(data, offset)
+        (stacks,) = _U16.unpack_from(data, offset + _STATS.size)
+        offset += _STATS.size + _U16.size
+        items = {item.name: item for item in Store.items}
+        for _ in range(stacks):
+            item_name, offset = _unpack_str(data, offset)
+            (count,) = _STACK.unpack_from(data, offset)
+            offset += _STACK.size
+            hero.inventory.add(items[item_name], count)
+        hero.observer, hero.rng = observer, rng
+        return hero, offset
+    if tag == ENEMY:
+        return _unpack_enemy(data, offset, observer, rng)
+    if tag == FACTORY:
+        classes, created, reused, pooled = _FACTORY.unpack_from(data, offset)
+        offset += _FACTORY.size
+        weights = {}
+        for _ in range(classes):
+            code, weight = _WEIGHT.unpack_from(data, offset)
+            offset += _WEIGHT.size
+            weights[ENEMY_KINDS[code]] = weight
+        factory = EnemyFactory(weights, observer, rng)
+        factory.created, factory.reused = created, reused
+        for _ in range(pooled):
+            enemy, offset = _unpack_enemy(data, offset, observer, rng)
+            factory.pool[type(enemy)].append(enemy)
+        return factory, offset
+    if tag == SHOE:
+        decks, cut, position, cards = _SHOE.unpack_from(data, offset)
+        offset += _SHOE.size
+        shoe = Shoe(decks=0, rng=rng)  # An empty shoe shuffles for free; its cards are filled in below
+        shoe.decks, shoe.cut, shoe.position = decks, cut, position
+        shoe.card_ids = array('B', data[offset:offset + cards])
+        return shoe, offset + cards
+    if tag == PLAYER:
+        name, offset = _unpack_str(data, offset)
+        (gold,) = _GOLD.unpack_from(data, offset)
+        player = Player(name, gold)
+        return player, _unpack_hand(player, data, offset + _GOLD.size)
+    if tag == DEALER:
+        dealer = Dealer()
+        return dealer, _unpack_hand(dealer, data, offset)
+    raise ValueError(f"Corrupt snapshot: unknown record tag {tag} at byte {offset - 1}")
+
+
+def _check_header(data):
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported snapshot version {data[len(MAGIC)]}")
+
+
+def _loads_records(data, offset, end, observer, rng):
+    objects = []
+    while offset < end:
+        obj, offset = _unpack(data, offset, observer, rng)
+        objects.append(obj)
+    return objects
+
+
+def dumps(*objects):
+    """Return a snapshot of the given game objects as bytes."""
+    return HEADER + b"".join(_pack(obj) for obj in objects)
+
+
+def loads(data, observer=None, rng=random):
+    """Rebuild the objects in a snapshot, in the order they were saved.
+
+    Restored characters and enemy pools get the given observer and random
+    source; shoes get the random source for their next reshuffle.
+    """
+    _check_header(data)
+    return _loads_records(data, len(HEADER), len(data), observer, rng)
+
+
+def save_sessions(path, sessions):
+    """Write many sessions to one file; sessions maps a key string to a sequence of game objects."""
+    keys = []
+    blobs = []
+    for key, objects in sessions.items():
+        keys.append(_pack_str(key))
+        blobs.append(b"".join(_pack(obj) for obj in objects))
+    # Blobs start after the header, the count and the whole index
+    offset = len(HEADER) + _COUNT.size + sum(len(key) for key in keys) + _ENTRY.size * len(keys)
+    index = []
+    for key, blob in zip(keys, blobs):
+        index += (key, _ENTRY.pack(offset, len(blob)))
+        offset += len(blob)
+    with open(path, "wb") as file:
+        file.write(HEADER + _COUNT.pack(len(keys)) + b"".join(index))
+        file.writelines(blobs)
+
+
+def _read_index(data):
+    """Return a dict of session key to (offset, length) for a mapped sessions file."""
+    _check_header(data)
+    (count,) = _COUNT.unpack_from(data, len(HEADER))
+    offset = len(HEADER) + _COUNT.size
+    index = {}
+    for _ in range(count):
+        key, offset = _unpack_str(data, offset)
+        index[key] = _ENTRY.unpack_from(data, offset)
+        offset += _ENTRY.size
+    return index
+
+
+class SessionFile:
+    """A sessions file kept mapped with its index in memory, so each session can be woken on demand."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = _read_index(self.data)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def load(self, key, observer=None, rng=random):
+        """Restore one session's objects."""
+        offset, length = self.index[key]
+        return _loads_records(self.data, offset, offset + length, observer, rng)
+
+    def items(self, observer=None, rng=random):
+        """Yield (key, objects) for every session, in the order they were saved."""
+        for key in self.index:
+            yield key, self.load(key, observer, rng)
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_session(path, key, observer=None, rng=random):
+    """Restore one session's objects from a sessions file."""
+    with SessionFile(path) as sessions:
+        return sessions.load(key, observer, rng)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from python_rpg import AlwaysAttack, Sword, Tonic, run_fight
+
+    spawner = EnemyFactory()
+    sessions = {}
+    for number in range(10_000):
+        hero = Hero(f"Hero {number}")
+        hero.coins = 100
+        for item in (Tonic(), Tonic(), Sword()):
+            hero.buy(item)
+        enemy = spawner.spawn()
+        run_fight(hero, enemy, AlwaysAttack())
+        spawner.release(enemy)
+        shoe = Shoe()
+        for _ in range(number % 200):
+            shoe.draw_id()
+        sessions[f"session-{number}"] = (hero, shoe, Player("Player", 1000 + number))
+
+    start = time.perf_counter()
+    blobs = [dumps(*objects) for objects in sessions.values()]
+    dumped = time.perf_counter() - start
+    start = time.perf_counter()
+    for blob in blobs:
+        loads(blob)
+    loaded = time.perf_counter() - start
+    print(f"{len(blobs):,} sessions, {sum(map(len, blobs)) / len(blobs):.0f} bytes each: "
+          f"dump {dumped / len(blobs) * 1e6:.1f}us, load {loaded / len(blobs) * 1e6:.1f}us per session")
+
+    path = os.path.join(tempfile.mkdtemp(), "sessions.snap")
+    start = time.perf_counter()
+    save_sessions(path, sessions)
+    saved = time.perf_counter() - start
+    with SessionFile(path) as hibernated:
+        start = time.perf_counter()
+        hero, shoe, player = hibernated.load("session-9999")
+        woke = time.perf_counter() - start
+    print(f"Saved all in {saved:.2f}s ({os.path.getsize(path):,} bytes); woke one in {woke * 1e6:.0f}us: "
+          f"{hero.status()!r}, {len(shoe)} cards left, {player.gold} gold")
+    print(f"Pool: {dumps(spawner).__len__()} bytes for {spawner.created} enemies")
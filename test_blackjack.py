@@ -0,0 +1,73 @@
+"""Tests for Blackjack.py's incremental hand valuation."""
+import unittest
+from itertools import combinations_with_replacement, product
+
+from Blackjack import Card, Player, VALUE_NAMES
+
+
+def loop_value(hand):
+    """The hand valuation loop Blackjack.py used before hands kept running totals."""
+    value = 0
+    aces = 0
+    for card in hand:
+        if card.value in ['J', 'Q', 'K']:
+            value += 10
+        elif card.value == 'A':
+            aces += 1
+        else:
+            value += int(card.value)
+    for _ in range(aces):
+        if value + 11 <= 21:
+            value += 11
+        else:
+            value += 1
+    return value
+
+
+def best_value(hand):
+    """The highest total of 21 or less over every way of counting the aces, else the lowest total."""
+    totals = {sum(choice) for choice in product(*((1, 11) if card.value == 'A' else (card.points,) for card in hand))}
+    under = [total for total in totals if total <= 21]
+    return max(under) if under else min(totals)
+
+
+class HandValueTest(unittest.TestCase):
+    def test_every_two_to_four_card_hand(self):
+        player = Player("Player", 0)
+        for size in (2, 3, 4):
+            for values in combinations_with_replacement(VALUE_NAMES, size):
+                hand = [Card("Hearts", value) for value in values]
+                player.clear_hand()
+                for card in hand:
+                    player.add_card(card)
+                value = player.calculate_hand_value()
+                with self.subTest(hand=values):
+                    self.assertEqual((player.hard_total, player.aces),
+                                     (sum(card.points for card in hand), values.count('A')))
+                    if values.count('A') <= 1:  # The old loop counted a second ace as 11 on top of the first
+                        self.assertEqual(value, loop_value(hand))
+                    self.assertEqual(value, best_value(hand))
+                    self.assertEqual(player.is_soft(), value == player.hard_total + 10)
+
+    def test_multi_ace_hands_count_one_ace_high_at_most(self):
+        player = Player("Player", 0)
+        for values, value, soft in ((("A", "A"), 12, True), (("A", "A", "10"), 12, False),
+                                    (("A", "A", "9"), 21, True), (("A", "A", "A", "K"), 13, False),
+                                    (("A", "6"), 17, True), (("A", "6", "K"), 17, False)):
+            player.clear_hand()
+            for card_value in values:
+                player.add_card(Card("Spades", card_value))
+            self.assertEqual((player.calculate_hand_value(), player.is_soft()), (value, soft), values)
+
+    def test_clear_hand_resets_totals(self):
+        player = Player("Player", 0)
+        player.add_card(Card("Clubs", "A"))
+        player.add_card(Card("Clubs", "K"))
+        player.clear_hand()
+        self.assertEqual((player.hand, player.hard_total, player.aces), ([], 0, 0))
+        self.assertEqual(player.calculate_hand_value(), 0)
+        self.assertFalse(player.is_soft())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for blackjack_counting's fast expected-value estimate and CountTracker."""
+import random
+import unittest
+
+from Blackjack import Shoe, CARD_ID_POINTS
+from blackjack_counting import CountTracker, estimated_value, expected_value, clear_caches
+
+# How far estimated_value() may drift from the exact value with up to two decks left
+TOLERANCE = 0.004
+
+# Depleted compositions (count of aces, twos, ..., ten-valued cards); chosen so the exact recursion stays quick
+DEPLETED = (
+    (4, 4, 4, 4, 4, 4, 4, 4, 4, 16),  # A full single deck
+    (2, 3, 3, 3, 3, 3, 3, 3, 3, 40),  # Two decks with most small cards gone
+    (0, 2, 2, 2, 2, 2, 2, 2, 2, 30),  # Ten-rich, no aces left
+    (1, 1, 1, 1, 1, 1, 1, 1, 1, 20),  # Deep in the shoe
+)
+
+
+class EstimatedValueTest(unittest.TestCase):
+    def tearDown(self):
+        clear_caches()
+
+    def test_estimate_tracks_exact_value(self):
+        for composition in DEPLETED:
+            with self.subTest(composition=composition):
+                self.assertAlmostEqual(estimated_value(composition), expected_value(composition), delta=TOLERANCE)
+
+    def test_empty_shoe_is_worth_nothing(self):
+        self.assertEqual(estimated_value((0,) * 10), 0.0)
+
+    def test_tracker_follows_a_shoe(self):
+        shoe = Shoe(2, rng=random.Random(3))
+        for _ in range(30):
+            shoe.draw_id()
+        tracker = CountTracker()
+        tracker.attach(shoe)
+        for _ in range(4):
+            shoe.draw_id()
+        left = shoe.card_ids[shoe.position:]
+        self.assertEqual(tracker.composition, tuple(sum(CARD_ID_POINTS[card] == points for card in left)
+                                                    for points in range(1, 11)))
+        self.assertEqual(tracker.remaining, len(shoe))
+        self.assertEqual(tracker.estimated_value(), estimated_value(tracker.composition))
+        shoe.reshuffle()
+        self.assertEqual(tracker.remaining, 104)
+
+
+if __name__ == "__main__":
+    unittest.main()
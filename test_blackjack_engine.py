@@ -0,0 +1,34 @@
+"""Tests for blackjack_engine.RoundEngine with decks and shoes that run low mid-round."""
+import random
+import unittest
+
+from Blackjack import Player, Shoe
+from blackjack_engine import RoundEngine, ThresholdStrategy, NO_BET
+
+
+class ShoeExhaustionTest(unittest.TestCase):
+    def play(self, engine, rounds=5000):
+        strategy = ThresholdStrategy(stand_on=21)  # Hit as long as possible to use up cards fast
+        for _ in range(rounds):
+            result = engine.play_round(strategy)
+            self.assertNotEqual(result.outcome, NO_BET)
+            self.assertGreaterEqual(len(engine.player.hand), 2)
+            self.assertGreaterEqual(len(engine.dealer.hand), 2)
+            self.assertTrue(result.player_value > 21 or result.dealer_value >= 17)
+
+    def test_deep_penetration_shoes_finish_every_round(self):
+        for penetration in (0.95, 1.0):
+            shoe = Shoe(1, penetration=penetration, rng=random.Random(1))
+            self.play(RoundEngine(Player("Player", 10 ** 9), shoe=shoe))
+
+    def test_deck_without_reshuffle_threshold_finishes_every_round(self):
+        self.play(RoundEngine(Player("Player", 10 ** 9), rng=random.Random(2), reshuffle_below=0))
+
+    def test_rejects_penetration_outside_unit_interval(self):
+        for penetration in (0, -0.5, 1.01):
+            with self.assertRaises(ValueError):
+                Shoe(1, penetration=penetration)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""In-process tests for blackjack_server: real sockets, one event loop, no subprocesses."""
+import asyncio
+import unittest
+
+from blackjack_server import BlackjackServer
+
+
+class Client:
+    """A line-protocol client connected to a test server."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, line):
+        self.writer.write(line.encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self):
+        """Return the next line without its newline, or None once the server has closed the connection."""
+        line = await asyncio.wait_for(self.reader.readline(), 5)
+        return line.decode().rstrip("\n") if line else None
+
+    async def expect(self, prefix):
+        line = await self.receive()
+        if line is None or not line.startswith(prefix):
+            raise AssertionError(f"expected {prefix!r}, got {line!r}")
+        return line
+
+    def close(self):
+        self.writer.close()
+
+
+class BlackjackServerTest(unittest.IsolatedAsyncioTestCase):
+    async def start(self, **options):
+        """Start a server on a free local port for the current test."""
+        server = await BlackjackServer(seed=1, **options).start()
+        self.addAsyncCleanup(self.stop, server)
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    async def stop(self, server):
+        server.close()
+        await server.wait_closed()
+
+    async def connect(self):
+        client = Client(*await asyncio.open_connection("127.0.0.1", self.port))
+        self.addCleanup(client.close)
+        return client
+
+    async def test_plays_a_round_and_quits(self):
+        await self.start(starting_gold=100)
+        client = await self.connect()
+        self.assertEqual(await client.receive(), "WELCOME 100")
+        await client.expect("BET?")
+        await client.send("BET 10")
+        await client.expect("HAND ")
+        await client.expect("DEALER ")
+        line = await client.receive()
+        if line == "ACTION?":
+            await client.send("STAND")
+            await client.expect("DEALER ")
+            line = await client.receive()
+        outcome, payout, gold = line.split()[1:]
+        self.assertIn(outcome, ("win", "dealer_bust", "loss", "push"))
+        self.assertEqual(int(gold), 90 + int(payout))
+        await client.expect("BET?")
+        await client.send("QUIT")
+        self.assertEqual(await client.receive(), f"BYE {gold}")
+        self.assertIsNone(await client.receive())
+
+    async def test_rejects_bad_bets_without_dropping_the_table(self):
+        await self.start(starting_gold=100)
+        client = await self.connect()
+        await client.expect("WELCOME")
+        for bet in ("BET ²", "BET -5", "BET 0", "BET ten", "BET", "HIT"):
+            await client.expect("BET?")
+            await client.send(bet)
+            await client.expect("ERROR expected BET")
+        await client.expect("BET?")
+        await client.send("BET 1000")
+        await client.expect("ERROR not enough gold")
+        await client.expect("BET?")
+        await client.send("BET 10")
+        await client.expect("HAND ")
+
+    async def test_refuses_connections_when_full(self):
+        await self.start(max_tables=1)
+        first = await self.connect()
+        await first.expect("WELCOME")
+        second = await self.connect()
+        self.assertEqual(await second.receive(), "ERROR server full")
+        self.assertIsNone(await second.receive())
+        await first.expect("BET?")
+        await first.send("QUIT")
+        await first.expect("BYE")
+        self.assertIsNone(await first.receive())
+        third = await self.connect()  # The freed table can be taken again
+        await third.expect("WELCOME")
+
+    async def test_drops_idle_clients(self):
+        await self.start(idle_timeout=0.2)
+        client = await self.connect()
+        await client.expect("WELCOME")
+        await client.expect("BET?")
+        self.assertEqual(await client.receive(), "BYE 1000")  # Sent once the idle timeout expires
+        self.assertIsNone(await client.receive())
+
+    async def test_drops_clients_sending_oversized_lines(self):
+        await self.start()
+        client = await self.connect()
+        await client.expect("WELCOME")
+        await client.expect("BET?")
+        await client.send("BET " + "9" * 100_000)  # Longer than the 64 KiB StreamReader limit
+        self.assertEqual(await client.receive(), "BYE 1000")
+        self.assertIsNone(await client.receive())
+        other = await self.connect()  # The server keeps serving other tables
+        await other.expect("WELCOME")
+
+
+if __name__ == "__main__":
+    unittest.main()
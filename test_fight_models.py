@@ -0,0 +1,78 @@
+"""Cross-checks of the three fight models: the exact solver, the NumPy simulator and run_fight() itself."""
+import math
+import random
+import unittest
+
+from python_rpg import Hero, AlwaysAttack, DoNothing, FleeBelow, run_fight
+from rpg_solver import ENEMY_TYPES, solve
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+POLICIES = (AlwaysAttack(), DoNothing(), FleeBelow(10))
+FIGHTS = 4000  # run_fight() fights per enemy and policy
+SIMULATED = 200_000  # rpg_vectorized fights per enemy and policy
+SIGMAS = 5  # Allowed distance from the exact value, in standard errors
+
+
+def policy_name(policy):
+    return type(policy).__name__
+
+
+def simulate_options(policy):
+    """Return the rpg_vectorized.simulate() options that play like a battle policy."""
+    if isinstance(policy, FleeBelow):
+        return {"flee_below": policy.threshold}
+    return {"idle": isinstance(policy, DoNothing)}
+
+
+class FightModelsTest(unittest.TestCase):
+    def assertClose(self, measured, exact, error, label):
+        """Check a sample mean against its exact value, allowing SIGMAS standard errors (and rounding noise)."""
+        self.assertLessEqual(abs(measured - exact), SIGMAS * error + 1e-9,
+                             f"{label}: measured {measured:.4f}, exact {exact:.4f}")
+
+    def assertMatches(self, odds, wins, fights, turns, turn_error, label):
+        """Compare a sampled win count and mean turns with the solver's FightOdds."""
+        win_error = math.sqrt(odds.win * (1 - odds.win) / fights)
+        self.assertClose(wins / fights, odds.win, win_error, f"{label} win rate")
+        if not odds.draw:  # The solver stops counting turns once a fight can no longer change; samples run on
+            self.assertClose(turns, odds.expected_turns, turn_error, f"{label} mean turns")
+
+    def test_run_fight_matches_solver(self):
+        rng = random.Random(11)
+        for name, cls in ENEMY_TYPES.items():
+            for policy in POLICIES:
+                odds = solve(name, policy)
+                wins = 0
+                turns = []
+                for _ in range(FIGHTS):
+                    hero, enemy = Hero(), cls()
+                    hero.rng = enemy.rng = rng
+                    result = run_fight(hero, enemy, policy)
+                    wins += result.winner == "hero"
+                    turns.append(result.turns)
+                mean = sum(turns) / FIGHTS
+                spread = math.sqrt(sum((t - mean) ** 2 for t in turns) / (FIGHTS - 1))
+                self.assertMatches(odds, wins, FIGHTS, mean, spread / math.sqrt(FIGHTS),
+                                   f"run_fight {name} {policy_name(policy)}")
+
+    @unittest.skipIf(numpy is None, "rpg_vectorized needs NumPy")
+    def test_simulate_matches_solver(self):
+        from rpg_vectorized import simulate, mean_turns
+
+        for name in ENEMY_TYPES:
+            for policy in POLICIES:
+                odds = solve(name, policy)
+                result = simulate(name, SIMULATED, seed=11, **simulate_options(policy))
+                turns = numpy.arange(len(result.turn_histogram))
+                mean = mean_turns(result)
+                variance = float((turns - mean) ** 2 @ result.turn_histogram) / (result.fights - 1)
+                self.assertMatches(odds, result.wins, result.fights, mean, math.sqrt(variance / result.fights),
+                                   f"simulate {name} {policy_name(policy)}")
+
+
+if __name__ == "__main__":
+    unittest.main()
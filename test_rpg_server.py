@@ -0,0 +1,61 @@
+"""In-process tests for rpg_server: real sockets, one event loop, no subprocesses."""
+import asyncio
+import os
+import tempfile
+import unittest
+
+from rpg_server import AdventureServer
+
+
+class AdventureServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.errors = []  # Exceptions that escaped a session and reached the event loop
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: self.errors.append(context))
+        self.adventures = AdventureServer(idle_timeout=5)
+        server = await self.adventures.start()
+        self.addAsyncCleanup(self.stop, server)
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def stop(self, server):
+        server.close()
+        await server.wait_closed()
+
+    async def play(self, *lines):
+        """Send lines to a new session and return everything it writes until it closes."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        for line in lines:
+            writer.write(line.encode() + b"\n")
+        await writer.drain()
+        output = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return output.decode()
+
+    async def test_shops_and_uses_an_item(self):
+        output = await self.play("Al", "2", "1", "q", "3", "tonic", "4")
+        self.assertIn("Al bought Tonic for 5 coins.", output)
+        self.assertIn("Al's health increased by 2. Current health: 24", output)
+        self.assertTrue(output.rstrip().endswith("Al flees from the adventure. Game Over!"))
+
+    async def test_ends_session_on_oversized_line(self):
+        output = await self.play("Al", "x" * 100_000)  # Longer than the 64 KiB StreamReader limit
+        self.assertIn("Enter your choice (1-4):", output)
+        self.assertEqual(self.adventures.sessions, 0)
+        self.assertIn("Game Over!", await self.play("Bo", "4"))  # Other sessions still work
+        self.assertEqual(self.errors, [])
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Unix sockets are not available")
+    async def test_serves_a_unix_socket(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "rpg.sock")
+        server = await self.adventures.start(path=path)
+        self.addAsyncCleanup(self.stop, server)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"Al\n4\n")
+        output = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        self.assertIn("Al flees from the adventure. Game Over!", output.decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
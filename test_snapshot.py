@@ -0,0 +1,138 @@
+"""Round-trip tests for the snapshot binary format."""
+import os
+import random
+import tempfile
+import unittest
+
+from python_rpg import Hero, Goblin, Zombie, Archer, Item, Tonic, Sword, EnemyFactory, Store
+from Blackjack import Shoe, Player, Dealer, Deck
+import snapshot
+from snapshot import dumps, loads, save_sessions, SessionFile, load_session
+
+
+def stats(character):
+    return character.name, character.health, character.power, character.coins, character.bounty
+
+
+def stock(hero):
+    return [(item.name, count) for item, count in hero.inventory]
+
+
+def hand(character):
+    return [str(card) for card in character.hand], character.calculate_hand_value(), character.is_soft()
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(5)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "sessions.bin")
+
+    def hero(self):
+        hero = Hero("Ada")
+        hero.coins = 100
+        for item in (Tonic(), Tonic(), Sword()):
+            hero.buy(item)
+        hero.health -= 3
+        return hero
+
+    def factory(self):
+        factory = EnemyFactory({Goblin: 2, Zombie: 1, Archer: 1}, rng=self.rng)
+        enemies = [factory.spawn() for _ in range(6)]
+        enemies[0].name = "Grik"
+        enemies[1].health -= 4
+        for enemy in enemies:
+            factory.release(enemy)
+        return factory
+
+    def table(self):
+        shoe = Shoe(2, penetration=0.8, rng=self.rng)
+        player, dealer = Player("Bo", 750), Dealer()
+        for character in (player, dealer, player, player):
+            character.draw(shoe)
+        return shoe, player, dealer
+
+    def test_round_trips_every_kind_of_object(self):
+        hero, factory = self.hero(), self.factory()
+        zombie = Zombie()
+        zombie.resurrections, zombie.name = 1, "Mort"
+        shoe, player, dealer = self.table()
+        observer = object()
+
+        restored = loads(dumps(hero, zombie, factory, shoe, player, dealer), observer=observer, rng=self.rng)
+        new_hero, new_zombie, new_factory, new_shoe, new_player, new_dealer = restored
+
+        self.assertEqual(stats(new_hero), stats(hero))
+        self.assertEqual(stock(new_hero), stock(hero))
+        self.assertIs(list(new_hero.inventory)[0][0], Store.items[0])  # Items come back as the Store's
+        self.assertIs(new_hero.observer, observer)
+
+        self.assertEqual((stats(new_zombie), new_zombie.resurrections), (stats(zombie), 1))
+
+        self.assertEqual((new_factory.classes, new_factory.cumulative), (factory.classes, factory.cumulative))
+        self.assertEqual((new_factory.created, new_factory.reused), (factory.created, factory.reused))
+        for cls, free in factory.pool.items():
+            self.assertEqual([stats(enemy) for enemy in new_factory.pool[cls]], [stats(enemy) for enemy in free])
+        self.assertIn("Grik", [enemy.name for free in new_factory.pool.values() for enemy in free])
+
+        self.assertEqual((new_shoe.decks, new_shoe.cut, new_shoe.position), (shoe.decks, shoe.cut, shoe.position))
+        self.assertEqual(new_shoe.card_ids, shoe.card_ids)
+        self.assertEqual(str(new_shoe.draw()), str(shoe.draw()))
+
+        self.assertEqual((new_player.name, new_player.gold), ("Bo", 750))
+        self.assertEqual(hand(new_player), hand(player))
+        self.assertEqual((new_player.hard_total, new_player.aces), (player.hard_total, player.aces))
+        self.assertEqual(hand(new_dealer), hand(dealer))
+
+    def test_soft_hands_are_recomputed(self):
+        player = Player("Cy", 10)
+        deck = Deck(self.rng)
+        deck.cards = [card for card in deck.cards if card.value in ("A", "6")][:3]
+        for _ in range(3):
+            player.draw(deck)
+        (restored,) = loads(dumps(player))
+        self.assertEqual(hand(restored), hand(player))
+
+    def test_refuses_items_the_store_does_not_sell(self):
+        hero = self.hero()
+        hero.buy(Item("Potion", 3))
+        with self.assertRaises(TypeError):
+            dumps(hero)
+
+    def test_sessions_file(self):
+        sessions = {f"player-{number}": (self.hero(), *self.table()) for number in range(20)}
+        sessions["empty"] = ()
+        path = self.path
+        save_sessions(path, sessions)
+        with SessionFile(path) as stored:
+            self.assertEqual(len(stored), len(sessions))
+            self.assertIn("player-7", stored)
+            hero, shoe, player, dealer = stored.load("player-7")
+            expected = sessions["player-7"]
+            self.assertEqual(stats(hero), stats(expected[0]))
+            self.assertEqual(shoe.card_ids, expected[1].card_ids)
+            self.assertEqual(hand(player), hand(expected[2]))
+            self.assertEqual(stored.load("empty"), [])
+            self.assertEqual([key for key, _ in stored.items()], list(sessions))
+        self.assertEqual(stats(load_session(path, "player-19")[0]), stats(sessions["player-19"][0]))
+
+    def test_rejects_other_versions_and_files(self):
+        data = bytearray(dumps(self.hero()))
+        data[len(snapshot.MAGIC)] = snapshot.VERSION - 1
+        with self.assertRaisesRegex(ValueError, "version"):
+            loads(bytes(data))
+        with self.assertRaisesRegex(ValueError, "Not a game snapshot"):
+            loads(b"RPGLOG\x02")
+
+        path = self.path
+        save_sessions(path, {"a": (self.hero(),)})
+        with open(path, "r+b") as file:
+            file.seek(len(snapshot.MAGIC))
+            file.write(bytes([snapshot.VERSION + 1]))
+        with self.assertRaisesRegex(ValueError, "version"):
+            SessionFile(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Balance-parameter sweeps for python_rpg.
+
+A Balance holds every tunable constant in python_rpg.py: the Hero's health,
+power and double-damage chance, each enemy's health, power and bounty, and the
+cost and effect of the Tonic and Sword. Tuner.evaluate() scores a Balance with
+exact fight odds from rpg_solver. The odds cover a fresh Hero, a Hero who has
+bought a Sword and one who has drunk a Tonic, each against every enemy type.
+
+Each matchup is cached under just the parameters it depends on. A sweep that
+only changes the Goblin's health therefore re-solves only the Goblin
+matchups, and a change to an item re-solves only the matchups of Heroes
+carrying that item. grid() walks a product of value ranges. search() does a
+coordinate descent toward the best score.
+"""
+from collections import namedtuple
+from itertools import product
+
+from python_rpg import Hero, Tonic, Sword, AlwaysAttack, ENEMY_WEIGHTS, HERO_CRIT_CHANCE
+from rpg_solver import FightSolver
+
+ENEMY_CLASSES = tuple(ENEMY_WEIGHTS)
+
+
+def _defaults():
+    """Return the field names and current values of every tunable constant."""
+    hero, tonic, sword = Hero(), Tonic(), Sword()
+    fields = {"hero_health": hero.health, "hero_power": hero.power, "hero_crit": HERO_CRIT_CHANCE}
+    for cls in ENEMY_CLASSES:
+        enemy = cls()
+        prefix = cls.__name__.lower()
+        fields.update({f"{prefix}_health": enemy.health, f"{prefix}_power": enemy.power,
+                       f"{prefix}_bounty": enemy.bounty})
+    # Item effects are the amounts Tonic.apply and Sword.apply add
+    fields.update({"tonic_cost": tonic.cost, "tonic_heal": 2, "sword_cost": sword.cost, "sword_power": 2})
+    return fields
+
+
+_DEFAULTS = _defaults()
+
+# Every tunable constant; DEFAULT_BALANCE holds the values currently in python_rpg.py
+Balance = namedtuple("Balance", _DEFAULTS)
+DEFAULT_BALANCE = Balance(**_DEFAULTS)
+
+# Summary of one Balance: enemy-weighted averages for a fresh Hero, plus the same win rate after each item
+Evaluation = namedtuple("Evaluation",
+                        "balance win loss turns coins sword_win tonic_win fights_per_sword fights_per_tonic odds")
+
+
+def target_win_rate(target=0.8, item_fights=3.0):
+    """Return a score (lower is better) for fights won close to a target rate, with items a few fights apart."""
+    def score(evaluation):
+        items = abs(evaluation.fights_per_sword - item_fights) + abs(evaluation.fights_per_tonic - item_fights)
+        return abs(evaluation.win - target) + 0.01 * items
+    return score
+
+
+class Tuner:
+    def __init__(self, policy=None, weights=None):
+        """Evaluate balances for fights under a battle policy, weighting enemies like EnemyFactory."""
+        self.policy = AlwaysAttack() if policy is None else policy
+        weights = ENEMY_WEIGHTS if weights is None else weights
+        total = sum(weights.values())
+        self.weights = {cls: weight / total for cls, weight in weights.items()}
+        self.cache = {}  # (enemy class, hero health, hero power, crit, enemy health, power, bounty) -> FightOdds
+        self.solved = 0  # Matchups solved from scratch
+        self.hits = 0  # Matchups answered from the cache
+
+    def matchup(self, cls, hero_health, hero_power, hero_crit, health, power, bounty):
+        """Return the exact FightOdds of one hero against one enemy type, solving it only once."""
+        key = (cls, hero_health, hero_power, hero_crit, health, power, bounty)
+        odds = self.cache.get(key)
+        if odds is None:
+            enemy = cls()
+            enemy.health, enemy.power, enemy.bounty = health, power, bounty
+            odds = self.cache[key] = FightSolver(enemy, self.policy, hero_health, hero_power, hero_crit).solve()
+            self.solved += 1
+        else:
+            self.hits += 1
+        return odds
+
+    def _weighted(self, balance, hero_health, hero_power):
+        """Return {enemy name: FightOdds} and the weighted win rate for one hero build."""
+        odds = {}
+        win = 0.0
+        for cls, weight in self.weights.items():
+            prefix = cls.__name__.lower()
+            result = self.matchup(cls, hero_health, hero_power, balance.hero_crit, getattr(balance, f"{prefix}_health"),
+                                  getattr(balance, f"{prefix}_power"), getattr(balance, f"{prefix}_bounty"))
+            odds[cls.__name__] = result
+            win += weight * result.win
+        return odds, win
+
+    def evaluate(self, balance):
+        """Return the Evaluation of a Balance."""
+        odds, win = self._weighted(balance, balance.hero_health, balance.hero_power)
+        _, sword_win = self._weighted(balance, balance.hero_health, balance.hero_power + balance.sword_power)
+        _, tonic_win = self._weighted(balance, balance.hero_health + balance.tonic_heal, balance.hero_power)
+        loss = turns = coins = 0.0
+        for cls, weight in self.weights.items():
+            result = odds[cls.__name__]
+            loss += weight * result.loss
+            turns += weight * result.expected_turns
+            coins += weight * result.expected_coins
+        per_fight = coins or float("nan")  # Bounties of 0 make items unaffordable
+        return Evaluation(balance, win, loss, turns, coins, sword_win, tonic_win,
+                          balance.sword_cost / per_fight, balance.tonic_cost / per_fight, odds)
+
+    def grid(self, base=DEFAULT_BALANCE, **ranges):
+        """Yield the Evaluation of every combination of the given field ranges, other fields taken from base."""
+        names = list(ranges)
+        for values in product(*ranges.values()):
+            yield self.evaluate(base._replace(**dict(zip(names, values))))
+
+    def search(self, score, base=DEFAULT_BALANCE, steps=None, bounds=None, max_rounds=100):
+        """Coordinate descent: nudge each field by its step while the score improves; return the best Evaluation.
+
+        steps maps field names to step sizes (every integer field by 1 if not
+        given); bounds maps field names to (low, high) limits, 1 and up by default.
+        """
+        if steps is None:
+            steps = {name: 1 for name, value in base._asdict().items() if isinstance(value, int)}
+        bounds = {} if bounds is None else bounds
+        best = self.evaluate(base)
+        best_score = score(best)
+        for _ in range(max_rounds):
+            improved = False
+            for name, step in steps.items():
+                low, high = bounds.get(name, (1, float("inf")))
+                for delta in (step, -step):
+                    value = getattr(best.balance, name) + delta
+                    if not low <= value <= high:
+                        continue
+                    candidate = self.evaluate(best.balance._replace(**{name: value}))
+                    candidate_score = score(candidate)
+                    if candidate_score < best_score:
+                        best, best_score, improved = candidate, candidate_score, True
+                        break
+            if not improved:
+                break
+        return best
+
+
+if __name__ == "__main__":
+    import time
+
+    tuner = Tuner()
+    start = time.perf_counter()
+    evaluations = list(tuner.grid(hero_health=range(10, 41, 2), hero_power=range(5, 16), goblin_health=range(10, 31, 4),
+                                  shadow_bounty=range(2, 11, 2)))
+    print(f"Grid of {len(evaluations):,} balances in {time.perf_counter() - start:.2f}s "
+          f"({tuner.solved:,} matchups solved, {tuner.hits:,} cached)")
+
+    start = time.perf_counter()
+    best = tuner.search(target_win_rate(0.75), steps={"hero_power": 1, "archer_power": 1, "shadow_bounty": 1,
+                                                      "sword_cost": 1, "tonic_cost": 1})
+    changed = {name: value for name, value in best.balance._asdict().items() if value != _DEFAULTS[name]}
+    print(f"Search for a 75% win rate in {time.perf_counter() - start:.2f}s: win {best.win:.3f}, "
+          f"{best.fights_per_sword:.1f} fights per sword; changes {changed}")